@@ -19,15 +19,26 @@ def dir_stat_fingerprint(path: Path) -> Dict[str, Any]:
     file_count = 0
     total_size = 0
 
-    for root, _, files in os.walk(path):
-        for fn in files:
-            fp = Path(root) / fn
-            try:
-                s = fp.stat()
-            except OSError:
-                continue
-            file_count += 1
-            total_size += int(s.st_size)
+    # Same traversal as os.walk(path) (symlinked dirs are not descended), but
+    # DirEntry already knows the entry type, so each file costs one stat at most
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                        continue
+                    s = entry.stat()
+                except OSError:
+                    continue
+                file_count += 1
+                total_size += int(s.st_size)
 
     return {
         "mtime": float(st.st_mtime),
@@ -5,7 +5,7 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from filelock import FileLock
 
@@ -140,6 +140,23 @@ def _upsert_output_entry(outputs: List[Dict[str, Any]], key: str, new_entry: Dic
     outputs[idx] = new_entry
 
 
+def _iter_dirty_targets(odir: Path, paths: Iterable[Union[str, Path]]) -> List[Path]:
+    """Return the dirty paths that live under ``odir``, deduplicated."""
+    out: List[Path] = []
+    seen = set()
+    for raw in paths:
+        p = Path(raw).expanduser()
+        try:
+            p = p.resolve()
+            p.relative_to(odir)
+        except (OSError, ValueError):
+            continue
+        if p not in seen:
+            seen.add(p)
+            out.append(p)
+    return out
+
+
 def scan_outputs_once(
     *,
     run_id: str,
@@ -157,7 +174,16 @@ def scan_outputs_once(
     mode: str = "rolling",
     log_snapshot_interval_sec: float = 60.0,
     state_gc_after_sec: float = 7 * 24 * 3600,
+    paths: Optional[Iterable[Union[str, Path]]] = None,
 ) -> Dict[str, Any]:
+    """Fingerprint output files/dirs and archive the ones that became stable.
+
+    When ``paths`` is given, only those paths (and the subtrees of any
+    directories among them) are examined instead of walking every output dir.
+    The result's ``pending`` list holds paths that were seen but deferred
+    (not yet stable, too young, or inside the log snapshot interval), so an
+    event-driven caller knows what to re-check on its next pass.
+    """
     all_pats = patterns or _default_patterns()
     file_pats, dir_pats = _split_patterns(all_pats)
 
@@ -170,267 +196,306 @@ def scan_outputs_once(
         scanned = 0
         archived_n = 0
         archived_entries: List[Dict[str, Any]] = []
+        pending: List[str] = []
+        # Targeted scans can reach the same entry twice (dirty file inside a dirty dir)
+        visited: Optional[set] = None if paths is None else set()
+
+        def _scan_dir_entry(dir_path: Path) -> None:
+            nonlocal scanned, archived_n, changed
+            if visited is not None:
+                if dir_path in visited:
+                    return
+                visited.add(dir_path)
+            scanned += 1
+            try:
+                st = dir_path.stat()
+            except OSError:
+                return
+
+            key_path: Path = dir_path
+            if _is_within(dir_path, workspace_root):
+                key_path = dir_path.resolve().relative_to(workspace_root.resolve())
+            key = _posix(key_path)
+
+            it = items.get(key) or {}
+            last_mtime_ns = it.get("last_mtime_ns")
+            stable_count = int(it.get("stable_count") or 0)
+            cur_mtime_ns = int(getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9)))
+            age = now - float(st.st_mtime)
+            if age < 0:
+                age = 0.0
+
+            if last_mtime_ns == cur_mtime_ns:
+                stable_count += 1
+            else:
+                stable_count = 1
+
+            it["last_mtime_ns"] = cur_mtime_ns
+            it["stable_count"] = stable_count
+            it["last_seen_at"] = now
+
+            if age < min_age_sec or stable_count < stable_required:
+                items[key] = it
+                pending.append(str(dir_path))
+                return
+
+            try:
+                if mode == "rolling":
+                    archived = archive_dir_overwrite(
+                        dir_path,
+                        storage_root / "archive",
+                        category="outputs",
+                        run_id=run_id,
+                        key=key,
+                    )
+                else:
+                    archived = archive_dir(dir_path, storage_root / "archive", category="outputs")
+            except Exception as e:
+                it["last_error"] = str(e)
+                items[key] = it
+                return
+
+            fp = archived.get("fingerprint")
+            if fp and it.get("last_archived_fingerprint") == fp:
+                items[key] = it
+                return
+
+            it["last_archived_fingerprint"] = fp
+            it["last_archived_at"] = now
+            it.pop("last_error", None)
+            items[key] = it
+
+            if _is_within(dir_path, workspace_root):
+                display_path = "./" + dir_path.resolve().relative_to(workspace_root.resolve()).as_posix()
+            else:
+                display_path = dir_path.as_posix()
+
+            entry = {
+                "key": key,
+                "name": Path(display_path).name,
+                "kind": "dir",
+                "path": display_path,
+                "saved": True,
+                "archive_path": archived.get("archive_path"),
+                "fingerprint_kind": archived.get("fingerprint_kind"),
+                "fingerprint": archived.get("fingerprint"),
+                "mode": mode,
+                "archived_at": int(now),
+            }
+
+            def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
+                outputs = a.setdefault("outputs", [])
+                _upsert_output_entry(outputs, key, entry, mode)
+                return a
+
+            update_assets_atomic(assets_path, assets_lock, _upd)
+
+            archived_entries.append(entry)
+            archived_n += 1
+            changed += 1
+
+        def _scan_file_entry(src: Path, odir: Path) -> None:
+            nonlocal scanned, archived_n, changed
+            if visited is not None:
+                if src in visited:
+                    return
+                visited.add(src)
+            try:
+                st = src.stat()
+            except OSError:
+                return
+
+            rel = src.relative_to(odir).as_posix()
+            if not _match_any(rel, file_pats):
+                return
+
+            scanned += 1
+            key_path = src
+            if _is_within(src, workspace_root):
+                key_path = src.resolve().relative_to(workspace_root.resolve())
+            key = _posix(key_path)
+
+            it = items.get(key) or {}
+            it["last_seen_at"] = now
+
+            is_log = _is_log_like(src)
+            if is_log:
+                last_snap = float(it.get("last_log_snapshot_at") or 0.0)
+                if log_snapshot_interval_sec > 0 and (now - last_snap) < float(log_snapshot_interval_sec):
+                    items[key] = it
+                    pending.append(str(src))
+                    return
+                try:
+                    archived = archive_file_overwrite_stat(
+                        src,
+                        storage_root / "archive",
+                        category="outputs",
+                        run_id=run_id,
+                        key=key,
+                    )
+                except Exception as e:
+                    it["last_error"] = str(e)
+                    items[key] = it
+                    return
 
-        for od in output_dirs:
-            odir = Path(od).expanduser().resolve()
-            if not odir.exists():
-                continue
-
-            for dirpath, dirnames, filenames in os.walk(odir):
+                fp = archived.get("fingerprint")
+                if fp and it.get("last_archived_fingerprint") == fp:
+                    it["last_log_snapshot_at"] = now
+                    it.pop("last_error", None)
+                    items[key] = it
+                    return
+
+                it["last_archived_fingerprint"] = fp
+                it["last_archived_at"] = now
+                it["last_log_snapshot_at"] = now
+                it.pop("last_error", None)
+                items[key] = it
+
+                if _is_within(src, workspace_root):
+                    display_path = "./" + src.resolve().relative_to(workspace_root.resolve()).as_posix()
+                else:
+                    display_path = src.as_posix()
+
+                entry = {
+                    "key": key,
+                    "name": Path(display_path).name,
+                    "kind": "file",
+                    "path": display_path,
+                    "saved": True,
+                    "archive_path": archived.get("archive_path"),
+                    "fingerprint_kind": archived.get("fingerprint_kind"),
+                    "fingerprint": archived.get("fingerprint"),
+                    "mode": "rolling",
+                    "archived_at": int(now),
+                }
+
+                def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
+                    outputs = a.setdefault("outputs", [])
+                    _upsert_output_entry(outputs, key, entry, "rolling")
+                    return a
+
+                update_assets_atomic(assets_path, assets_lock, _upd)
+
+                archived_entries.append(entry)
+                archived_n += 1
+                changed += 1
+                return
+
+            last_size = it.get("last_size")
+            last_mtime_ns = it.get("last_mtime_ns")
+            stable_count = int(it.get("stable_count") or 0)
+
+            cur_size = int(st.st_size)
+            cur_mtime_ns = int(getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9)))
+            age = now - float(st.st_mtime)
+            if age < 0:
+                age = 0.0
+
+            if last_size == cur_size and last_mtime_ns == cur_mtime_ns:
+                stable_count += 1
+            else:
+                stable_count = 1
+
+            it["last_size"] = cur_size
+            it["last_mtime_ns"] = cur_mtime_ns
+            it["stable_count"] = stable_count
+
+            if age < min_age_sec or stable_count < stable_required:
+                items[key] = it
+                pending.append(str(src))
+                return
+
+            try:
+                if mode == "rolling":
+                    archived = archive_file_overwrite(
+                        src,
+                        storage_root / "archive",
+                        category="outputs",
+                        run_id=run_id,
+                        key=key,
+                    )
+                else:
+                    archived = archive_file(src, storage_root / "archive", category="outputs")
+            except Exception as e:
+                it["last_error"] = str(e)
+                items[key] = it
+                return
+
+            fp = archived.get("fingerprint")
+            if fp and it.get("last_archived_fingerprint") == fp:
+                it.pop("last_error", None)
+                items[key] = it
+                return
+
+            it["last_archived_fingerprint"] = fp
+            it["last_archived_at"] = now
+            it.pop("last_error", None)
+            items[key] = it
+
+            if _is_within(src, workspace_root):
+                display_path = "./" + src.resolve().relative_to(workspace_root.resolve()).as_posix()
+            else:
+                display_path = src.as_posix()
+
+            entry = {
+                "key": key,
+                "name": Path(display_path).name,
+                "kind": "file",
+                "path": display_path,
+                "saved": True,
+                "archive_path": archived.get("archive_path"),
+                "fingerprint_kind": archived.get("fingerprint_kind"),
+                "fingerprint": archived.get("fingerprint"),
+                "mode": mode,
+                "archived_at": int(now),
+            }
+
+            def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
+                outputs = a.setdefault("outputs", [])
+                _upsert_output_entry(outputs, key, entry, mode)
+                return a
+
+            update_assets_atomic(assets_path, assets_lock, _upd)
+
+            archived_entries.append(entry)
+            archived_n += 1
+            changed += 1
+
+        def _scan_tree(top: Path, odir: Path) -> None:
+            for dirpath, dirnames, filenames in os.walk(top):
                 dp = Path(dirpath)
 
                 rel_dir = dp.relative_to(odir).as_posix() if dp != odir else ""
                 for d in list(dirnames):
                     rel = f"{rel_dir}/{d}" if rel_dir else d
                     if dir_pats and _match_any(rel + "/", dir_pats):
-                        scanned += 1
-                        dir_path = dp / d
-                        try:
-                            st = dir_path.stat()
-                        except OSError:
-                            continue
-
-                        key_path: Path = dir_path
-                        if _is_within(dir_path, workspace_root):
-                            key_path = dir_path.resolve().relative_to(workspace_root.resolve())
-                        key = _posix(key_path)
-
-                        it = items.get(key) or {}
-                        last_mtime_ns = it.get("last_mtime_ns")
-                        stable_count = int(it.get("stable_count") or 0)
-                        cur_mtime_ns = int(getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9)))
-                        age = now - float(st.st_mtime)
-                        if age < 0:
-                            age = 0.0
-
-                        if last_mtime_ns == cur_mtime_ns:
-                            stable_count += 1
-                        else:
-                            stable_count = 1
-
-                        it["last_mtime_ns"] = cur_mtime_ns
-                        it["stable_count"] = stable_count
-                        it["last_seen_at"] = now
-
-                        if age < min_age_sec or stable_count < stable_required:
-                            items[key] = it
-                            continue
-
-                        try:
-                            if mode == "rolling":
-                                archived = archive_dir_overwrite(
-                                    dir_path,
-                                    storage_root / "archive",
-                                    category="outputs",
-                                    run_id=run_id,
-                                    key=key,
-                                )
-                            else:
-                                archived = archive_dir(dir_path, storage_root / "archive", category="outputs")
-                        except Exception as e:
-                            it["last_error"] = str(e)
-                            items[key] = it
-                            continue
-
-                        fp = archived.get("fingerprint")
-                        if fp and it.get("last_archived_fingerprint") == fp:
-                            items[key] = it
-                            continue
-
-                        it["last_archived_fingerprint"] = fp
-                        it["last_archived_at"] = now
-                        it.pop("last_error", None)
-                        items[key] = it
-
-                        if _is_within(dir_path, workspace_root):
-                            display_path = "./" + dir_path.resolve().relative_to(workspace_root.resolve()).as_posix()
-                        else:
-                            display_path = dir_path.as_posix()
-
-                        entry = {
-                            "key": key,
-                            "name": Path(display_path).name,
-                            "kind": "dir",
-                            "path": display_path,
-                            "saved": True,
-                            "archive_path": archived.get("archive_path"),
-                            "fingerprint_kind": archived.get("fingerprint_kind"),
-                            "fingerprint": archived.get("fingerprint"),
-                            "mode": mode,
-                            "archived_at": int(now),
-                        }
-
-                        def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
-                            outputs = a.setdefault("outputs", [])
-                            _upsert_output_entry(outputs, key, entry, mode)
-                            return a
-
-                        update_assets_atomic(assets_path, assets_lock, _upd)
-
-                        archived_entries.append(entry)
-                        archived_n += 1
-                        changed += 1
+                        _scan_dir_entry(dp / d)
 
                 for fn in filenames:
-                    src = dp / fn
-                    try:
-                        st = src.stat()
-                    except OSError:
-                        continue
-
-                    rel = src.relative_to(odir).as_posix()
-                    if not _match_any(rel, file_pats):
-                        continue
-
-                    scanned += 1
-                    key_path = src
-                    if _is_within(src, workspace_root):
-                        key_path = src.resolve().relative_to(workspace_root.resolve())
-                    key = _posix(key_path)
-
-                    it = items.get(key) or {}
-                    it["last_seen_at"] = now
-
-                    is_log = _is_log_like(src)
-                    if is_log:
-                        last_snap = float(it.get("last_log_snapshot_at") or 0.0)
-                        if log_snapshot_interval_sec > 0 and (now - last_snap) < float(log_snapshot_interval_sec):
-                            items[key] = it
-                            continue
-                        try:
-                            archived = archive_file_overwrite_stat(
-                                src,
-                                storage_root / "archive",
-                                category="outputs",
-                                run_id=run_id,
-                                key=key,
-                            )
-                        except Exception as e:
-                            it["last_error"] = str(e)
-                            items[key] = it
-                            continue
-
-                        fp = archived.get("fingerprint")
-                        if fp and it.get("last_archived_fingerprint") == fp:
-                            it["last_log_snapshot_at"] = now
-                            it.pop("last_error", None)
-                            items[key] = it
-                            continue
-
-                        it["last_archived_fingerprint"] = fp
-                        it["last_archived_at"] = now
-                        it["last_log_snapshot_at"] = now
-                        it.pop("last_error", None)
-                        items[key] = it
-
-                        if _is_within(src, workspace_root):
-                            display_path = "./" + src.resolve().relative_to(workspace_root.resolve()).as_posix()
-                        else:
-                            display_path = src.as_posix()
-
-                        entry = {
-                            "key": key,
-                            "name": Path(display_path).name,
-                            "kind": "file",
-                            "path": display_path,
-                            "saved": True,
-                            "archive_path": archived.get("archive_path"),
-                            "fingerprint_kind": archived.get("fingerprint_kind"),
-                            "fingerprint": archived.get("fingerprint"),
-                            "mode": "rolling",
-                            "archived_at": int(now),
-                        }
-
-                        def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
-                            outputs = a.setdefault("outputs", [])
-                            _upsert_output_entry(outputs, key, entry, "rolling")
-                            return a
-
-                        update_assets_atomic(assets_path, assets_lock, _upd)
-
-                        archived_entries.append(entry)
-                        archived_n += 1
-                        changed += 1
-                        continue
-
-                    last_size = it.get("last_size")
-                    last_mtime_ns = it.get("last_mtime_ns")
-                    stable_count = int(it.get("stable_count") or 0)
-
-                    cur_size = int(st.st_size)
-                    cur_mtime_ns = int(getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9)))
-                    age = now - float(st.st_mtime)
-                    if age < 0:
-                        age = 0.0
-
-                    if last_size == cur_size and last_mtime_ns == cur_mtime_ns:
-                        stable_count += 1
-                    else:
-                        stable_count = 1
-
-                    it["last_size"] = cur_size
-                    it["last_mtime_ns"] = cur_mtime_ns
-                    it["stable_count"] = stable_count
-
-                    if age < min_age_sec or stable_count < stable_required:
-                        items[key] = it
-                        continue
-
-                    try:
-                        if mode == "rolling":
-                            archived = archive_file_overwrite(
-                                src,
-                                storage_root / "archive",
-                                category="outputs",
-                                run_id=run_id,
-                                key=key,
-                            )
-                        else:
-                            archived = archive_file(src, storage_root / "archive", category="outputs")
-                    except Exception as e:
-                        it["last_error"] = str(e)
-                        items[key] = it
-                        continue
-
-                    fp = archived.get("fingerprint")
-                    if fp and it.get("last_archived_fingerprint") == fp:
-                        it.pop("last_error", None)
-                        items[key] = it
-                        continue
-
-                    it["last_archived_fingerprint"] = fp
-                    it["last_archived_at"] = now
-                    it.pop("last_error", None)
-                    items[key] = it
+                    _scan_file_entry(dp / fn, odir)
+
+        for od in output_dirs:
+            odir = Path(od).expanduser().resolve()
+            if not odir.exists():
+                continue
+
+            if paths is None:
+                _scan_tree(odir, odir)
+                continue
 
-                    if _is_within(src, workspace_root):
-                        display_path = "./" + src.resolve().relative_to(workspace_root.resolve()).as_posix()
-                    else:
-                        display_path = src.as_posix()
-
-                    entry = {
-                        "key": key,
-                        "name": Path(display_path).name,
-                        "kind": "file",
-                        "path": display_path,
-                        "saved": True,
-                        "archive_path": archived.get("archive_path"),
-                        "fingerprint_kind": archived.get("fingerprint_kind"),
-                        "fingerprint": archived.get("fingerprint"),
-                        "mode": mode,
-                        "archived_at": int(now),
-                    }
-
-                    def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
-                        outputs = a.setdefault("outputs", [])
-                        _upsert_output_entry(outputs, key, entry, mode)
-                        return a
-
-                    update_assets_atomic(assets_path, assets_lock, _upd)
-
-                    archived_entries.append(entry)
-                    archived_n += 1
-                    changed += 1
+            for target in _iter_dirty_targets(odir, paths):
+                # Adding/removing entries bumps the mtime of every enclosing directory,
+                # so ancestors that match a directory pattern are re-checked too.
+                if dir_pats:
+                    anc = target if target.is_dir() else target.parent
+                    while anc != odir:
+                        if _match_any(anc.relative_to(odir).as_posix() + "/", dir_pats):
+                            _scan_dir_entry(anc)
+                        anc = anc.parent
+                if target.is_dir():
+                    _scan_tree(target, odir)
+                elif target.is_file():
+                    _scan_file_entry(target, odir)
 
         if state_gc_after_sec and state_gc_after_sec > 0:
             cutoff = now - float(state_gc_after_sec)
@@ -449,4 +514,5 @@ def scan_outputs_once(
             "archived": archived_n,
             "changed": changed,
             "archived_entries": archived_entries,
+            "pending": pending,
         }
@@ -122,5 +122,5 @@ class NoOpRun:
     def summary(self, update: Dict[str, Any]) -> None:
         return None
 
-    def finish(self, status: str = "finished") -> None:
+    def finish(self, status: str = "finished", *, archive_timeout: Optional[float] = None) -> None:
         return None
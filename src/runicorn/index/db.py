@@ -4,8 +4,9 @@ import json
 import sqlite3
 import threading
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from filelock import FileLock
 
@@ -60,6 +61,23 @@ class IndexDb:
                 pass
         self._local.conn = None
 
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        # Inside batch() the commit is deferred to the end of the block
+        if not getattr(self._local, "batching", False):
+            conn.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the writes issued inside the block into a single transaction."""
+        with self._lock:
+            conn = self._connect()
+            self._local.batching = True
+            try:
+                yield
+            finally:
+                self._local.batching = False
+                conn.commit()
+
     def _ensure_schema(self) -> None:
         with self._lock:
             conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
@@ -148,7 +166,7 @@ ON CONFLICT(run_id) DO UPDATE SET
 """,
                 (run_id, path, alias, float(created_at), status, run_dir, workspace_root),
             )
-            conn.commit()
+            self._commit(conn)
 
     def finish_run(self, *, run_id: str, status: str, ended_at: float) -> None:
         with self._lock:
@@ -157,7 +175,7 @@ ON CONFLICT(run_id) DO UPDATE SET
                 "UPDATE runs SET status=?, ended_at=? WHERE run_id=?",
                 (status, float(ended_at), run_id),
             )
-            conn.commit()
+            self._commit(conn)
 
     def upsert_asset(
         self,
@@ -203,7 +221,7 @@ INSERT INTO assets(
                         metadata_json,
                     ),
                 )
-                conn.commit()
+                self._commit(conn)
                 return asset_id
             except sqlite3.IntegrityError:
                 if fingerprint:
@@ -222,7 +240,7 @@ INSERT INTO assets(
                 "INSERT OR IGNORE INTO run_assets(run_id, asset_id, role, created_at) VALUES(?, ?, ?, ?)",
                 (run_id, asset_id, role, created_at),
             )
-            conn.commit()
+            self._commit(conn)
 
     def record_asset_for_run(
         self,
@@ -335,7 +353,7 @@ WHERE ra.run_id = ?
                 "DELETE FROM run_assets WHERE run_id=? AND asset_id=?",
                 (run_id, asset_id),
             )
-            conn.commit()
+            self._commit(conn)
 
     def delete_asset(self, asset_id: str) -> None:
         """Delete an asset record (does not delete files)."""
@@ -343,7 +361,7 @@ WHERE ra.run_id = ?
             conn = self._connect()
             # CASCADE will delete run_assets links
             conn.execute("DELETE FROM assets WHERE asset_id=?", (asset_id,))
-            conn.commit()
+            self._commit(conn)
 
     def delete_run(self, run_id: str) -> None:
         """Delete a run record (does not delete files)."""
@@ -351,7 +369,7 @@ WHERE ra.run_id = ?
             conn = self._connect()
             # CASCADE will delete run_assets links
             conn.execute("DELETE FROM runs WHERE run_id=?", (run_id,))
-            conn.commit()
+            self._commit(conn)
 
     def delete_run_with_orphan_assets(self, run_id: str) -> Dict[str, Any]:
         """
@@ -410,7 +428,7 @@ WHERE ra.run_id = ?
             for asset in orphaned:
                 conn.execute("DELETE FROM assets WHERE asset_id=?", (asset["asset_id"],))
             
-            conn.commit()
+            self._commit(conn)
             
             return {
                 "orphaned_assets": orphaned,
@@ -26,6 +26,24 @@ from .known_hosts import compute_fingerprint_sha256, format_known_hosts_host
 
 logger = logging.getLogger(__name__)
 
+# AEAD ciphers negotiated first when the server offers them: AES-GCM runs on
+# AES-NI/PCLMULQDQ and needs no separate MAC pass, unlike aes*-ctr + hmac-sha2
+_PREFERRED_CIPHERS = ("aes128-gcm@openssh.com", "aes256-gcm@openssh.com")
+
+
+def _make_transport(sock, **kwargs) -> paramiko.Transport:
+    """Transport factory for SSHClient.connect that reorders cipher preference.
+
+    Other ciphers stay enabled (after the preferred ones) so servers without
+    GCM support still negotiate as before.
+    """
+    transport = paramiko.Transport(sock, **kwargs)
+    opts = transport.get_security_options()
+    available = tuple(opts.ciphers)
+    preferred = tuple(c for c in _PREFERRED_CIPHERS if c in available)
+    opts.ciphers = preferred + tuple(c for c in available if c not in preferred)
+    return transport
+
 
 @dataclass
 class SSHConfig:
@@ -40,6 +58,9 @@ class SSHConfig:
     use_agent: bool = True
     timeout: int = 30
     keepalive_interval: int = 30  # Send keepalive every 30s
+    # zlib on the whole transport: worthwhile for JSON/log traffic, pure CPU
+    # overhead for already-compressed payloads (checkpoints, images, archives).
+    # Negotiated once per connection; the pool reconnects when it changes.
     compression: bool = True
     
     def get_key(self) -> str:
@@ -155,6 +176,7 @@ class SSHConnection:
                     "timeout": self.config.timeout,
                     "compress": self.config.compression,
                     "allow_agent": self.config.use_agent,
+                    "transport_factory": _make_transport,
                 }
                 
                 # Add authentication
@@ -387,14 +409,17 @@ class SSHConnectionPool:
             # Check if connection exists and is healthy
             if key in self._pool:
                 conn = self._pool[key]
-                if conn.is_connected:
+                if conn.is_connected and conn.config.compression == config.compression:
                     logger.debug(f"Reusing connection: {key}")
                     return conn
+                if conn.is_connected:
+                    # Compression is fixed at connect time; reconnect to change it
+                    logger.info(f"Reconnecting {key} with compression={config.compression}")
                 else:
                     # Connection dead, remove it
                     logger.info(f"Removing dead connection: {key}")
-                    conn.disconnect()
-                    del self._pool[key]
+                conn.disconnect()
+                del self._pool[key]
             
             # Create new connection
             logger.info(f"Creating new connection: {key}")
@@ -225,7 +225,9 @@ class OpenSSHTunnel:
                 break
             if self._proc.poll() is not None:
                 break
-            time.sleep(0.05)
+            # Event.wait returns as soon as stop() is called, unlike sleep()
+            if self._stop_event.wait(0.05):
+                break
 
         if self._proc.poll() is not None:
             if stderr_thread is not None:
@@ -298,7 +300,7 @@ class OpenSSHTunnel:
                         self._proc.returncode,
                     )
                     break
-                time.sleep(0.2)
+                self._stop_event.wait(0.2)
         finally:
             self.stop()
 
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import atexit
+import gc
+import itertools
 import json
 import logging
+import math
+import operator
 import os
 import platform
+import queue
+import re
 import socket
 import sys
 import threading
 import time
-import uuid
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from filelock import FileLock
 from .config import get_user_root_dir
@@ -72,17 +82,117 @@ except ImportError:
     HAS_NUMPY = False
     logger.debug("NumPy not available, array image features limited")
 
+# Optional: filesystem events for watch_outputs (falls back to polling)
+try:
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    from watchdog.observers import Observer  # type: ignore
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = None  # type: ignore
+    Observer = None  # type: ignore
+    HAS_WATCHDOG = False
+
+# Optional: faster JSON encoding for run-dir files
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
+
 
 DEFAULT_DIRNAME = ".runicorn"
 
+_COMPACT = (",", ":")
+
+_ATOMIC_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Shared compact encoder for events.jsonl lines (avoids building an encoder per json.dumps call)
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=_COMPACT).encode
+
+# Index writes are batched by a background worker: one transaction per window
+_INDEX_FLUSH_INTERVAL_SEC = 0.25
+_INDEX_BATCH_MAX_OPS = 100
+
+# summary() updates landing within this window are written out together
+_SUMMARY_FLUSH_INTERVAL_SEC = 0.05
+# Summary keys mirrored onto the experiment record in modern storage
+_SUMMARY_STORAGE_FIELDS = (
+    "best_metric_value",
+    "best_metric_name",
+    "best_metric_step",
+    "best_metric_mode",
+)
+
 _active_run_lock = threading.Lock()
 _active_run: Optional["Run"] = None
 
+# Process-invariant host info, computed once instead of per Run
+_PY_VERSION = sys.version.split(" ")[0]
+_PLATFORM_STR = f"{platform.system()} {platform.release()} ({platform.machine()})"
+_HOSTNAME = socket.gethostname()
+
 
 def _now_ts() -> float:
     return time.time()
 
 
+def _loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON bytes, preferring orjson when installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson rejects NaN/Infinity, which json.dumps writes by default
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether obj contains a NaN or +/-Infinity float at any depth."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Encode obj as UTF-8 JSON (indented, or compact if not pretty), preferring orjson."""
+    if HAS_ORJSON:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            data = orjson.dumps(obj, option=option)
+            # orjson writes NaN/Infinity as null; json keeps them, so only
+            # output that could hide one needs the (slower) check
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+        except TypeError:
+            # e.g. ints beyond 64 bits or types orjson does not know; let json decide
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=_COMPACT).encode("utf-8")
+
+
+_RAW_IMAGE_MODES = {3: "RGB", 4: "RGBA"}
+
+
+def _array_to_image(arr: Any) -> Any:
+    """Convert a numpy array to a PIL image.
+
+    C-contiguous uint8 HxWx3/HxWx4 arrays are wrapped with Image.frombuffer,
+    which skips fromarray's mode inference and stride handling.
+    """
+    if arr.dtype == np.uint8 and arr.ndim == 3 and arr.flags.c_contiguous:
+        mode = _RAW_IMAGE_MODES.get(arr.shape[2])
+        if mode is not None:
+            return Image.frombuffer(mode, (arr.shape[1], arr.shape[0]), arr, "raw", mode, 0, 1)
+    return Image.fromarray(arr)
+
+
 def _default_storage_dir(storage: Optional[str]) -> Path:
     # Priority:
     # 1) Explicit storage argument
@@ -100,17 +210,40 @@ def _default_storage_dir(storage: Optional[str]) -> Path:
     return (Path.cwd() / DEFAULT_DIRNAME).resolve()
 
 
+# Run id suffix: a per-process counter seeded randomly, so ids stay unique
+# within a process and unlikely to collide across processes.
+_run_seq = itertools.count(int.from_bytes(os.urandom(3), "big"))
+_run_id_second: tuple = (-1, "")
+
+
+def _reseed_run_seq() -> None:
+    # A forked child inherits the parent's counter; give it its own sequence
+    global _run_seq
+    _run_seq = itertools.count(int.from_bytes(os.urandom(3), "big"))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_run_seq)
+
+
 def _gen_run_id() -> str:
-    # timestamp + short random suffix for readability
-    ts = time.strftime("%Y%m%d_%H%M%S", time.localtime())
-    suf = uuid.uuid4().hex[:6]
-    return f"{ts}_{suf}"
+    # timestamp + short suffix for readability
+    global _run_id_second
+    sec = time.time_ns() // 1_000_000_000
+    cached_sec, ts = _run_id_second
+    if cached_sec != sec:
+        ts = time.strftime("%Y%m%d_%H%M%S", time.localtime(sec))
+        _run_id_second = (sec, ts)
+    return f"{ts}_{next(_run_seq) & 0xFFFFFF:06x}"
 
 
 def get_active_run() -> Optional["Run"]:
     return _active_run
 
 
+_PATH_CHARS_RE = re.compile(r'^[a-zA-Z0-9_\-/]+$')
+
+
 def _normalize_path(path: Optional[str]) -> str:
     """Normalize experiment path.
     
@@ -134,8 +267,7 @@ def _normalize_path(path: Optional[str]) -> str:
     path = path.strip("/")
     
     # Validate path characters
-    import re
-    if not re.match(r'^[a-zA-Z0-9_\-/]+$', path):
+    if not _PATH_CHARS_RE.match(path):
         raise ValueError(
             f"Invalid path: '{path}'. "
             "Path can only contain letters, numbers, underscores, hyphens, and forward slashes."
@@ -227,15 +359,40 @@ class Run:
         self._assets_lock = FileLock(str(self._assets_path) + ".lock")
         self._outputs_state_lock = FileLock(str(self._outputs_state_path) + ".lock")
 
+        # In-memory copies of summary.json/status.json; updates are merged here and
+        # written out atomically instead of re-reading the file each time
+        self._summary_cache: Dict[str, Any] = self._read_json_or_empty(self._summary_path)
+        self._status_cache: Dict[str, Any] = {}
+
+        # summary() only marks the cache dirty; a background thread coalesces writes
+        self._summary_cache_lock = threading.Lock()
+        self._pending_storage_updates: Dict[str, Any] = {}
+        self._storage_inflight: Optional[Future] = None
+        self._summary_file_dirty = False
+        self._summary_dirty = threading.Event()
+        self._summary_flush_stop = threading.Event()
+        self._summary_flush_thread: Optional[threading.Thread] = None
+
         self.workspace_root = get_workspace_root(workspace_root)
         self._outputs_watch_thread: Optional[threading.Thread] = None
         self._outputs_watch_stop = threading.Event()
+        self._outputs_watch_wake = threading.Event()
+        self._outputs_observer: Any = None
 
+        # IndexDb is opened by the index worker on first use, off the init() path
         self._index_db: Optional[IndexDb] = None
-        try:
-            self._index_db = IndexDb(self.storage_root)
-        except Exception:
-            self._index_db = None
+        self._index_db_failed = False
+        self._index_queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._index_thread: Optional[threading.Thread] = None
+        self._index_thread_lock = threading.Lock()
+        self._index_stopped = False
+
+        # Background archiving for log_dataset/log_pretrained(save=True), created on first use
+        self._archive_pool: Optional[ThreadPoolExecutor] = None
+        self._archive_futures: List[Future] = []
+
+        # Sequence for media filenames; run_id already namespaces them, so no random suffix needed
+        self._media_counter = itertools.count(1)
 
         # Global step counter for metrics logging
         # Starts from 0; first auto step will be 1
@@ -244,20 +401,19 @@ class Run:
         # Primary metric tracking
         self._primary_metric_name: Optional[str] = None
         self._primary_metric_mode: str = "max"  # "max" or "min"
+        self._is_better: Callable[[Any, Any], bool] = operator.gt
         self._best_metric_value: Optional[float] = None
         self._best_metric_step: Optional[int] = None
+        self._best_lock = threading.Lock()
         
-        # Initialize modern storage backend
-        self.storage_backend = None
+        # Modern storage backend, created on first access of self.storage_backend
+        self._storage_backend: Optional[Any] = None
+        self._storage_backend_lock = threading.Lock()
+        self._started_at = _now_ts()
         
         # Allow disabling modern storage via environment variable (useful for testing)
         disable_modern_storage = os.environ.get("RUNICORN_DISABLE_MODERN_STORAGE", "").lower() in ("1", "true", "yes")
-        
-        if HAS_MODERN_STORAGE and not disable_modern_storage:
-            try:
-                self._init_modern_storage()
-            except Exception as e:
-                logger.warning(f"Failed to initialize modern storage: {e}, using file-only mode")
+        self._storage_backend_pending = HAS_MODERN_STORAGE and not disable_modern_storage
         
         # Optional monitoring
         self.monitor = None
@@ -271,29 +427,27 @@ class Run:
             path=self.path,
             alias=self.alias,
             created_at=_now_ts(),
-            python=sys.version.split(" ")[0],
-            platform=f"{platform.system()} {platform.release()} ({platform.machine()})",
-            hostname=socket.gethostname(),
+            python=_PY_VERSION,
+            platform=_PLATFORM_STR,
+            hostname=_HOSTNAME,
             pid=os.getpid(),
             storage_dir=str(self.storage_root),
             workspace_root=str(self.workspace_root),
         )
         self._write_json(self._meta_path, asdict(meta))
-        self._write_json(self._status_path, {"status": "running", "started_at": _now_ts()})
+        self._status_cache = {"status": "running", "started_at": _now_ts()}
+        self._write_json(self._status_path, self._status_cache)
 
-        if self._index_db is not None:
-            try:
-                self._index_db.upsert_run(
-                    run_id=self.id,
-                    path=self.path,
-                    alias=self.alias,
-                    created_at=float(meta.created_at),
-                    status="running",
-                    run_dir=str(self.run_dir),
-                    workspace_root=str(self.workspace_root),
-                )
-            except Exception:
-                pass
+        self._index_submit(
+            "upsert_run",
+            run_id=self.id,
+            path=self.path,
+            alias=self.alias,
+            created_at=float(meta.created_at),
+            status="running",
+            run_dir=str(self.run_dir),
+            workspace_root=str(self.workspace_root),
+        )
 
         ensure_assets_file(self._assets_path)
 
@@ -321,26 +475,23 @@ class Run:
 
             update_assets_atomic(self._assets_path, self._assets_lock, _upd)
 
-            if self._index_db is not None:
-                try:
-                    self._index_db.record_asset_for_run(
-                        run_id=self.id,
-                        role="code",
-                        asset_type="code_snapshot",
-                        name="code_snapshot.zip",
-                        source_uri=str(self.workspace_root),
-                        archive_uri=archived.get("archive_path"),
-                        is_archived=True,
-                        fingerprint_kind=archived.get("fingerprint_kind"),
-                        fingerprint=archived.get("fingerprint"),
-                        created_at=float(meta.created_at),
-                        metadata={
-                            "format": "zip",
-                            "workspace_root": str(self.workspace_root),
-                        },
-                    )
-                except Exception:
-                    pass
+            self._index_submit(
+                "record_asset_for_run",
+                run_id=self.id,
+                role="code",
+                asset_type="code_snapshot",
+                name="code_snapshot.zip",
+                source_uri=str(self.workspace_root),
+                archive_uri=archived.get("archive_path"),
+                is_archived=True,
+                fingerprint_kind=archived.get("fingerprint_kind"),
+                fingerprint=archived.get("fingerprint"),
+                created_at=float(meta.created_at),
+                metadata={
+                    "format": "zip",
+                    "workspace_root": str(self.workspace_root),
+                },
+            )
 
         if capture_env and HAS_ENV_CAPTURE:
             try:
@@ -351,6 +502,9 @@ class Run:
             except Exception as e:
                 logger.warning(f"Failed to capture environment: {e}")
 
+        # All optional subsystems are resolved now; pick the log() fast path if possible
+        self._select_log_impl()
+
         # Console capture (initialized after _logs_txt_path is set)
         self._console_capture = None
         self._capture_console = capture_console
@@ -367,7 +521,6 @@ class Run:
                 logger.debug(f"Console capture started for run {self.id}")
             except Exception as e:
                 # Graceful degradation: log warning and continue without capture
-                import warnings
                 warnings.warn(
                     f"Failed to initialize console capture: {e}. "
                     "Continuing without capture.",
@@ -386,6 +539,7 @@ class Run:
         mode: str = "rolling",
         log_snapshot_interval_sec: float = 60.0,
         state_gc_after_sec: float = 7 * 24 * 3600,
+        paths: Optional[List[Union[str, Path]]] = None,
     ) -> Dict[str, Any]:
         res = scan_outputs_once(
             run_id=self.id,
@@ -403,30 +557,28 @@ class Run:
             mode=mode,
             log_snapshot_interval_sec=log_snapshot_interval_sec,
             state_gc_after_sec=state_gc_after_sec,
+            paths=paths,
         )
 
-        if self._index_db is not None:
-            try:
-                for e in res.get("archived_entries") or []:
-                    self._index_db.record_asset_for_run(
-                        run_id=self.id,
-                        role="output",
-                        asset_type="output",
-                        name=e.get("name"),
-                        source_uri=e.get("path"),
-                        archive_uri=e.get("archive_path"),
-                        is_archived=True,
-                        fingerprint_kind=e.get("fingerprint_kind"),
-                        fingerprint=e.get("fingerprint"),
-                        created_at=float(e.get("archived_at") or 0),
-                        metadata={
-                            "key": e.get("key"),
-                            "kind": e.get("kind"),
-                            "mode": e.get("mode"),
-                        },
-                    )
-            except Exception:
-                pass
+        for e in res.get("archived_entries") or []:
+            self._index_submit(
+                "record_asset_for_run",
+                run_id=self.id,
+                role="output",
+                asset_type="output",
+                name=e.get("name"),
+                source_uri=e.get("path"),
+                archive_uri=e.get("archive_path"),
+                is_archived=True,
+                fingerprint_kind=e.get("fingerprint_kind"),
+                fingerprint=e.get("fingerprint"),
+                created_at=float(e.get("archived_at") or 0),
+                metadata={
+                    "key": e.get("key"),
+                    "kind": e.get("kind"),
+                    "mode": e.get("mode"),
+                },
+            )
 
         return res
 
@@ -442,66 +594,163 @@ class Run:
         log_snapshot_interval_sec: float = 60.0,
         state_gc_after_sec: float = 7 * 24 * 3600,
     ) -> None:
+        """Archive output files in the background as they become stable.
+
+        With ``watchdog`` installed, filesystem events wake the watcher and only
+        the changed paths (plus entries still waiting to become stable) are
+        re-scanned. Without it, every output dir is re-scanned each ``interval_sec``.
+        """
         if self._outputs_watch_thread and self._outputs_watch_thread.is_alive():
             return
         self._outputs_watch_stop.clear()
+        self._outputs_watch_wake.clear()
+
+        scan_kwargs: Dict[str, Any] = dict(
+            output_dirs=output_dirs,
+            patterns=patterns,
+            stable_required=stable_required,
+            min_age_sec=min_age_sec,
+            mode=mode,
+            log_snapshot_interval_sec=log_snapshot_interval_sec,
+            state_gc_after_sec=state_gc_after_sec,
+        )
 
-        def _loop() -> None:
+        dirty: set = set()
+        dirty_lock = threading.Lock()
+        observer = None
+        if HAS_WATCHDOG:
+            observer = self._start_outputs_observer(output_dirs, dirty, dirty_lock)
+
+        def _poll_loop() -> None:
             while not self._outputs_watch_stop.is_set():
                 try:
-                    self.scan_outputs_once(
-                        output_dirs=output_dirs,
-                        patterns=patterns,
-                        stable_required=stable_required,
-                        min_age_sec=min_age_sec,
-                        mode=mode,
-                        log_snapshot_interval_sec=log_snapshot_interval_sec,
-                        state_gc_after_sec=state_gc_after_sec,
-                    )
+                    self.scan_outputs_once(**scan_kwargs)
                 except Exception:
                     pass
                 self._outputs_watch_stop.wait(interval_sec)
 
-        t = threading.Thread(target=_loop, daemon=True)
+        def _event_loop() -> None:
+            # Full pass first to establish state, then only dirty + pending paths
+            pending: set = set()
+            first = True
+            while not self._outputs_watch_stop.is_set():
+                with dirty_lock:
+                    targets = dirty | pending
+                    dirty.clear()
+                if first or targets:
+                    try:
+                        res = self.scan_outputs_once(
+                            paths=None if first else list(targets), **scan_kwargs
+                        )
+                        pending = set(res.get("pending") or [])
+                    except Exception:
+                        pending = targets
+                    first = False
+                self._outputs_watch_wake.wait(interval_sec)
+                self._outputs_watch_wake.clear()
+                # Coalesce bursts of events (e.g. a checkpoint being written in chunks)
+                self._outputs_watch_stop.wait(min(0.5, interval_sec))
+
+        t = threading.Thread(
+            target=_event_loop if observer is not None else _poll_loop, daemon=True
+        )
         self._outputs_watch_thread = t
         t.start()
 
+    def _start_outputs_observer(
+        self,
+        output_dirs: List[Union[str, Path]],
+        dirty: set,
+        dirty_lock: threading.Lock,
+    ) -> Any:
+        """Start a watchdog observer that records changed paths; returns None on failure."""
+        wake = self._outputs_watch_wake
+
+        class _Handler(FileSystemEventHandler):  # type: ignore[misc, valid-type]
+            def on_any_event(self, event: Any) -> None:
+                with dirty_lock:
+                    dirty.add(event.src_path)
+                    dest = getattr(event, "dest_path", None)
+                    if dest:
+                        dirty.add(dest)
+                wake.set()
+
+        try:
+            dirs = [Path(od).expanduser().resolve() for od in output_dirs]
+            # Dirs created later could not be watched; let the polling loop handle them
+            if not dirs or not all(d.is_dir() for d in dirs):
+                return None
+            observer = Observer()
+            handler = _Handler()
+            for odir in dirs:
+                observer.schedule(handler, str(odir), recursive=True)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.debug(f"Filesystem watcher unavailable, polling outputs instead: {e}")
+            return None
+        self._outputs_observer = observer
+        return observer
+
     def stop_outputs_watch(self) -> None:
         self._outputs_watch_stop.set()
+        self._outputs_watch_wake.set()
+        observer = self._outputs_observer
+        if observer is not None:
+            self._outputs_observer = None
+            try:
+                observer.stop()
+                observer.join(timeout=2.0)
+            except Exception:
+                pass
         t = self._outputs_watch_thread
         if t and t.is_alive():
             t.join(timeout=2.0)
 
+    @property
+    def storage_backend(self) -> Optional[Any]:
+        """Modern storage backend, initialized on first access (None if unavailable)."""
+        if self._storage_backend_pending:
+            with self._storage_backend_lock:
+                if self._storage_backend_pending:
+                    try:
+                        self._init_modern_storage()
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize modern storage: {e}, using file-only mode")
+                    finally:
+                        self._storage_backend_pending = False
+        return self._storage_backend
+
     def _init_modern_storage(self) -> None:
         """Initialize modern storage backend."""
         try:
             # Initialize SQLite backend
-            self.storage_backend = SQLiteStorageBackend(self.storage_root)
+            self._storage_backend = SQLiteStorageBackend(self.storage_root)
             
             # Create experiment record in modern storage
             experiment = ExperimentRecord(
                 id=self.id,
                 path=self.path,
                 alias=self.alias,
-                created_at=_now_ts(),
+                created_at=self._started_at,
                 updated_at=_now_ts(),
                 status="running",
                 pid=os.getpid(),
-                python_version=sys.version.split(" ")[0],
-                platform=f"{platform.system()} {platform.release()} ({platform.machine()})",
-                hostname=socket.gethostname(),
+                python_version=_PY_VERSION,
+                platform=_PLATFORM_STR,
+                hostname=_HOSTNAME,
                 run_dir=str(self.run_dir)
             )
             
             # Use synchronous wrapper to safely create experiment
             from .storage.sync_utils import create_experiment_sync
-            create_experiment_sync(self.storage_backend, experiment)
+            create_experiment_sync(self._storage_backend, experiment)
             
-            logger.info(f"✅ Modern storage initialized: {type(self.storage_backend).__name__}")
+            logger.info(f"✅ Modern storage initialized: {type(self._storage_backend).__name__}")
             
         except Exception as e:
             logger.error(f"Failed to initialize modern storage: {e}")
-            self.storage_backend = None
+            self._storage_backend = None
             raise
 
     # ---------------- public API -----------------
@@ -515,11 +764,14 @@ class Run:
         if mode not in ["max", "min"]:
             raise ValueError(f"Mode must be 'max' or 'min', got '{mode}'")
         
-        self._primary_metric_name = metric_name
+        # Interned so the per-log dict lookup hits the identity fast path
+        self._primary_metric_name = sys.intern(metric_name)
         self._primary_metric_mode = mode
+        self._is_better = operator.gt if mode == "max" else operator.lt
         self._best_metric_value = None  # Reset when changing metric
         self._best_metric_step = None
         
+        self._select_log_impl()
         logger.info(f"Set primary metric: {metric_name} (mode: {mode})")
     
     def log(self, data: Optional[Dict[str, Any]] = None, *, step: Optional[int] = None, stage: Optional[Any] = None, **kwargs: Any) -> None:
@@ -534,17 +786,93 @@ class Run:
         - Always records 'global_step' and 'time' into the event data.
         - If 'stage' is provided (or present in data), records it for UI separators.
         """
+        ts, payload, stage_val = self._write_metrics_event(data, step, stage, kwargs)
+
+        # Also write to modern storage if available
+        if self.storage_backend:
+            try:
+                # Convert metrics to MetricRecord format. All records share the
+                # single `ts` read above; run-level fields are bound to locals once.
+                exp_id = self.id
+                step_val = self._global_step
+                metrics = [
+                    MetricRecord(
+                        experiment_id=exp_id,
+                        timestamp=ts,
+                        metric_name=metric_name,
+                        metric_value=metric_value,
+                        step=step_val,
+                        stage=stage_val,
+                    )
+                    for metric_name, metric_value in payload.items()
+                    if metric_name not in ("global_step", "time", "stage")
+                    and isinstance(metric_value, (int, float))
+                ]
+                
+                if metrics:
+                    # Use synchronous wrapper to safely log metrics
+                    from .storage.sync_utils import log_metrics_sync
+                    log_metrics_sync(self.storage_backend, self.id, metrics)
+                        
+            except Exception as e:
+                logger.debug(f"Failed to log to modern storage: {e}")
+        
+        # Update primary metric best value if configured
+        self._update_best_metric(payload)
+        
+        # Check for anomalies if monitoring is enabled
+        if self.monitor:
+            try:
+                alerts = self.monitor.check_metrics(payload)
+                for alert in alerts:
+                    self.log_text(alert)
+            except Exception as e:
+                logger.debug(f"Monitoring check failed: {e}")
+
+    def _log_minimal(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        step: Optional[int] = None,
+        stage: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Variant of log() used when there is no storage backend, monitor or primary metric."""
+        self._write_metrics_event(data, step, stage, kwargs)
+
+    def _select_log_impl(self) -> None:
+        """Bind self.log to the cheapest implementation for the current configuration."""
+        no_storage = self._storage_backend is None and not self._storage_backend_pending
+        if no_storage and self.monitor is None and self._primary_metric_name is None:
+            self.log = self._log_minimal  # type: ignore[method-assign]
+        else:
+            self.__dict__.pop("log", None)
+
+    def _write_metrics_event(
+        self,
+        data: Optional[Dict[str, Any]],
+        step: Optional[int],
+        stage: Optional[Any],
+        kwargs: Dict[str, Any],
+    ) -> tuple:
+        """Build the metrics payload, append it to events.jsonl and return (ts, payload, stage)."""
         ts = _now_ts()
-        payload: Dict[str, Any] = {}
-        if data:
-            payload.update(data)
-        if kwargs:
-            payload.update(kwargs)
+        # `kwargs` is the fresh dict built for this call, so it can be used as-is;
+        # `data` belongs to the caller and is copied.
+        payload: Dict[str, Any]
+        if not data:
+            payload = kwargs
+        else:
+            payload = dict(data)
+            if kwargs:
+                payload.update(kwargs)
 
         # Normalize and prioritize explicit params over payload
         # Remove any user-provided 'step' keys to avoid ambiguity; we always store 'global_step'
-        payload.pop("global_step", None)
-        payload.pop("step", None)
+        if "global_step" in payload:
+            del payload["global_step"]
+        if "step" in payload:
+            del payload["step"]
 
         # Determine step value
         if step is not None:
@@ -557,7 +885,7 @@ class Run:
             self._global_step += 1
 
         # Determine stage value (explicit arg has priority)
-        stage_in_payload = payload.pop("stage", None)
+        stage_in_payload = payload.pop("stage") if "stage" in payload else None
         stage_val = stage if stage is not None else stage_in_payload
 
         # Inject normalized tracking fields
@@ -569,44 +897,7 @@ class Run:
         # Write to traditional events.jsonl (always for compatibility)
         evt = {"ts": ts, "type": "metrics", "data": payload}
         self._append_jsonl(self._events_path, evt, self._events_lock)
-        
-        # Also write to modern storage if available
-        if self.storage_backend:
-            try:
-                # Convert metrics to MetricRecord format
-                metrics = []
-                for metric_name, metric_value in payload.items():
-                    if metric_name in ("global_step", "time", "stage"):
-                        continue
-                    if isinstance(metric_value, (int, float)):
-                        metrics.append(MetricRecord(
-                            experiment_id=self.id,
-                            timestamp=ts,
-                            metric_name=metric_name,
-                            metric_value=metric_value,
-                            step=self._global_step,
-                            stage=stage_val
-                        ))
-                
-                if metrics:
-                    # Use synchronous wrapper to safely log metrics
-                    from .storage.sync_utils import log_metrics_sync
-                    log_metrics_sync(self.storage_backend, self.id, metrics)
-                        
-            except Exception as e:
-                logger.debug(f"Failed to log to modern storage: {e}")
-        
-        # Update primary metric best value if configured
-        self._update_best_metric(payload)
-        
-        # Check for anomalies if monitoring is enabled
-        if self.monitor:
-            try:
-                alerts = self.monitor.check_metrics(payload)
-                for alert in alerts:
-                    self.log_text(alert)
-            except Exception as e:
-                logger.debug(f"Monitoring check failed: {e}")
+        return ts, payload, stage_val
 
     def log_text(self, text: str) -> None:
         # Write to logs.txt to support Live Logs viewer
@@ -652,7 +943,9 @@ class Run:
 
         Returns the relative path of the saved image.
         """
-        rel_name = f"{int(_now_ts()*1000)}_{uuid.uuid4().hex[:6]}_{key}.{format.lower()}"
+        # Single clock read: the millisecond form names the file, the float goes into the event
+        ts = _now_ts()
+        rel_name = f"{int(ts * 1000)}_{next(self._media_counter):06x}_{key}.{format.lower()}"
         path = self.media_dir / rel_name
 
         # Accept PIL.Image, numpy array, bytes, path-like
@@ -662,7 +955,7 @@ class Run:
             elif HAS_NUMPY and hasattr(image, "shape"):  # numpy array
                 if not HAS_PIL:
                     raise RuntimeError("Pillow is required to save numpy arrays. Install with: pip install pillow")
-                img = Image.fromarray(image)
+                img = _array_to_image(image)
                 img.save(path, format=format.upper(), quality=quality)
             elif isinstance(image, (bytes, bytearray)):
                 with open(path, "wb") as f:
@@ -680,7 +973,7 @@ class Run:
             raise
 
         evt = {
-            "ts": _now_ts(),
+            "ts": ts,
             "type": "image",
             "data": {"key": key, "path": f"media/{rel_name}", "step": step, "caption": caption},
         }
@@ -711,23 +1004,20 @@ class Run:
 
         update_assets_atomic(self._assets_path, self._assets_lock, _upd)
 
-        if self._index_db is not None:
-            try:
-                self._index_db.record_asset_for_run(
-                    run_id=self.id,
-                    role="config",
-                    asset_type="config",
-                    name=None,
-                    source_uri=None,
-                    archive_uri=None,
-                    is_archived=False,
-                    fingerprint_kind=None,
-                    fingerprint=None,
-                    created_at=_now_ts(),
-                    metadata=cfg_holder,
-                )
-            except Exception:
-                pass
+        self._index_submit(
+            "record_asset_for_run",
+            run_id=self.id,
+            role="config",
+            asset_type="config",
+            name=None,
+            source_uri=None,
+            archive_uri=None,
+            is_archived=False,
+            fingerprint_kind=None,
+            fingerprint=None,
+            created_at=_now_ts(),
+            metadata=cfg_holder,
+        )
 
     def log_dataset(
         self,
@@ -741,13 +1031,19 @@ class Run:
         max_archive_bytes: int = 5 * 1024 * 1024 * 1024,
         max_archive_files: int = 2_000_000,
     ) -> None:
+        """Record a dataset reference; with ``save=True`` it is archived in the background.
+
+        While archiving, the assets.json entry has ``"saved": "pending"``; it becomes
+        ``True`` (with archive fields) or ``False`` (with ``archive_error``) when done.
+        """
         uri: Any = root_or_uri
         fp: Optional[Dict[str, Any]] = None
-        archived: Optional[Dict[str, Any]] = None
+        archive_job: Optional[Callable[[], Dict[str, Any]]] = None
 
         if isinstance(root_or_uri, (str, Path)):
             p = Path(root_or_uri).expanduser()
             uri = str(p)
+            archive_root = self.storage_root / "archive"
             try:
                 if p.is_dir():
                     fp = dir_stat_fingerprint(p)
@@ -755,14 +1051,14 @@ class Run:
                         if (fp.get("total_size_bytes") or 0) > max_archive_bytes or (fp.get("file_count") or 0) > max_archive_files:
                             if not force_save:
                                 raise ValueError("dataset too large to archive; set force_save=True or use save=False")
-                        archived = archive_dir(p, self.storage_root / "archive", category="datasets")
+                        archive_job = partial(archive_dir, p, archive_root, category="datasets")
                 elif p.is_file():
                     fp = stat_fingerprint(p)
                     if save:
                         if (fp.get("size_bytes") or 0) > max_archive_bytes:
                             if not force_save:
                                 raise ValueError("dataset file too large to archive; set force_save=True or use save=False")
-                        archived = archive_file(p, self.storage_root / "archive", category="datasets")
+                        archive_job = partial(archive_file, p, archive_root, category="datasets")
             except OSError:
                 fp = None
 
@@ -771,11 +1067,37 @@ class Run:
             "context": context,
             "uri": uri,
             "description": description,
-            "saved": bool(save and archived),
+            "saved": False,
             "fingerprint": fp,
         }
-        if archived:
-            entry.update(archived)
+
+        def _index(e: Dict[str, Any]) -> None:
+            fp_kind = e.get("fingerprint_kind")
+            fp_val = e.get("fingerprint")
+            if isinstance(fp_val, dict):
+                fp_val = json.dumps(fp_val, ensure_ascii=False, sort_keys=True)
+                fp_kind = fp_kind or "stat"
+            self._index_submit(
+                "record_asset_for_run",
+                run_id=self.id,
+                role="dataset",
+                asset_type="dataset",
+                name=name,
+                source_uri=str(e.get("uri")) if e.get("uri") is not None else None,
+                archive_uri=e.get("archive_path"),
+                is_archived=e.get("saved") is True,
+                fingerprint_kind=fp_kind,
+                fingerprint=fp_val,
+                created_at=_now_ts(),
+                metadata={
+                    "context": context,
+                    "description": description,
+                },
+            )
+
+        if archive_job is not None:
+            self._submit_archive("datasets", entry, archive_job, _index)
+            return
 
         def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
             a.setdefault("datasets", [])
@@ -783,32 +1105,7 @@ class Run:
             return a
 
         update_assets_atomic(self._assets_path, self._assets_lock, _upd)
-
-        if self._index_db is not None:
-            try:
-                fp_kind = entry.get("fingerprint_kind")
-                fp_val = entry.get("fingerprint")
-                if isinstance(fp_val, dict):
-                    fp_val = json.dumps(fp_val, ensure_ascii=False, sort_keys=True)
-                    fp_kind = fp_kind or "stat"
-                self._index_db.record_asset_for_run(
-                    run_id=self.id,
-                    role="dataset",
-                    asset_type="dataset",
-                    name=name,
-                    source_uri=str(entry.get("uri")) if entry.get("uri") is not None else None,
-                    archive_uri=entry.get("archive_path"),
-                    is_archived=bool(entry.get("saved")),
-                    fingerprint_kind=fp_kind,
-                    fingerprint=fp_val,
-                    created_at=_now_ts(),
-                    metadata={
-                        "context": context,
-                        "description": description,
-                    },
-                )
-            except Exception:
-                pass
+        _index(entry)
 
     def log_pretrained(
         self,
@@ -822,35 +1119,61 @@ class Run:
         max_archive_bytes: int = 5 * 1024 * 1024 * 1024,
         max_archive_files: int = 2_000_000,
     ) -> None:
-        archived: Optional[Dict[str, Any]] = None
+        """Record a pretrained model; with ``save=True`` it is archived in the background.
+
+        See log_dataset() for how the pending archive is reflected in assets.json.
+        """
+        archive_job: Optional[Callable[[], Dict[str, Any]]] = None
 
         if save and path_or_uri is None:
             raise ValueError("save=True requires path_or_uri")
 
         if save and isinstance(path_or_uri, (str, Path)):
             p = Path(path_or_uri).expanduser()
+            archive_root = self.storage_root / "archive"
             if p.is_dir():
                 fp = dir_stat_fingerprint(p)
                 if (fp.get("total_size_bytes") or 0) > max_archive_bytes or (fp.get("file_count") or 0) > max_archive_files:
                     if not force_save:
                         raise ValueError("pretrained dir too large to archive; set force_save=True or use save=False")
-                archived = archive_dir(p, self.storage_root / "archive", category="pretrained")
+                archive_job = partial(archive_dir, p, archive_root, category="pretrained")
             elif p.is_file():
                 fp2 = stat_fingerprint(p)
                 if (fp2.get("size_bytes") or 0) > max_archive_bytes:
                     if not force_save:
                         raise ValueError("pretrained file too large to archive; set force_save=True or use save=False")
-                archived = archive_file(p, self.storage_root / "archive", category="pretrained")
+                archive_job = partial(archive_file, p, archive_root, category="pretrained")
 
         entry: Dict[str, Any] = {
             "name": name,
             "source_type": source_type,
             "path_or_uri": None if path_or_uri is None else (str(path_or_uri) if isinstance(path_or_uri, (str, Path)) else path_or_uri),
             "description": description,
-            "saved": bool(save and archived),
+            "saved": False,
         }
-        if archived:
-            entry.update(archived)
+
+        def _index(e: Dict[str, Any]) -> None:
+            self._index_submit(
+                "record_asset_for_run",
+                run_id=self.id,
+                role="pretrained",
+                asset_type="pretrained",
+                name=name,
+                source_uri=str(e.get("path_or_uri")) if e.get("path_or_uri") is not None else None,
+                archive_uri=e.get("archive_path"),
+                is_archived=e.get("saved") is True,
+                fingerprint_kind=e.get("fingerprint_kind"),
+                fingerprint=e.get("fingerprint"),
+                created_at=_now_ts(),
+                metadata={
+                    "source_type": source_type,
+                    "description": description,
+                },
+            )
+
+        if archive_job is not None:
+            self._submit_archive("pretrained", entry, archive_job, _index)
+            return
 
         def _upd(a: Dict[str, Any]) -> Dict[str, Any]:
             a.setdefault("pretrained", [])
@@ -858,117 +1181,227 @@ class Run:
             return a
 
         update_assets_atomic(self._assets_path, self._assets_lock, _upd)
+        _index(entry)
+
+    def _submit_archive(
+        self,
+        section: str,
+        entry: Dict[str, Any],
+        archive_job: Callable[[], Dict[str, Any]],
+        on_done: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Append ``entry`` to assets.json as pending and run ``archive_job`` in the background."""
+        entry["saved"] = "pending"
+        pos: Dict[str, int] = {}
+
+        def _append(a: Dict[str, Any]) -> Dict[str, Any]:
+            items = a.setdefault(section, [])
+            items.append(entry)
+            pos["i"] = len(items) - 1
+            return a
+
+        update_assets_atomic(self._assets_path, self._assets_lock, _append)
 
-        if self._index_db is not None:
+        def _task() -> None:
             try:
-                self._index_db.record_asset_for_run(
-                    run_id=self.id,
-                    role="pretrained",
-                    asset_type="pretrained",
-                    name=name,
-                    source_uri=str(entry.get("path_or_uri")) if entry.get("path_or_uri") is not None else None,
-                    archive_uri=entry.get("archive_path"),
-                    is_archived=bool(entry.get("saved")),
-                    fingerprint_kind=entry.get("fingerprint_kind"),
-                    fingerprint=entry.get("fingerprint"),
-                    created_at=_now_ts(),
-                    metadata={
-                        "source_type": source_type,
-                        "description": description,
-                    },
-                )
-            except Exception:
-                pass
+                result: Dict[str, Any] = dict(archive_job())
+                result["saved"] = True
+            except Exception as e:
+                logger.warning(f"Failed to archive {section} '{entry.get('name')}': {e}")
+                result = {"saved": False, "archive_error": str(e)}
+            entry.update(result)
+
+            def _finalize(a: Dict[str, Any]) -> Dict[str, Any]:
+                items = a.get(section) or []
+                i = pos.get("i", -1)
+                if (
+                    0 <= i < len(items)
+                    and items[i].get("name") == entry["name"]
+                    and items[i].get("saved") == "pending"
+                ):
+                    items[i].update(result)
+                return a
+
+            update_assets_atomic(self._assets_path, self._assets_lock, _finalize)
+            on_done(entry)
+
+        if self._archive_pool is None:
+            self._archive_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="runicorn-archive"
+            )
+        self._archive_futures.append(self._archive_pool.submit(_task))
+
+    def _wait_archives(self, timeout: Optional[float]) -> None:
+        """Wait for background archives submitted by log_dataset/log_pretrained."""
+        pool = self._archive_pool
+        if pool is None:
+            return
+        futures = self._archive_futures
+        _, not_done = wait_futures(futures, timeout=timeout)
+        if not_done:
+            logger.warning(
+                f"{len(not_done)} archive job(s) still running after {timeout}s; "
+                "not waiting further"
+            )
+        self._archive_futures = []
+        self._archive_pool = None
+        pool.shutdown(wait=False)
 
     def summary(self, update: Dict[str, Any]) -> None:
-        # Update traditional summary.json file (always for compatibility)
-        with self._summary_lock:
-            cur: Dict[str, Any] = {}
-            if self._summary_path.exists():
-                try:
-                    cur = json.loads(self._summary_path.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Failed to read summary file: {e}, starting fresh")
-                    cur = {}
-            cur.update(update or {})
-            self._summary_path.write_text(json.dumps(cur, ensure_ascii=False, indent=2), encoding="utf-8")
-        
+        """Merge ``update`` into the run summary.
+
+        summary.json is written by a background thread that coalesces updates
+        arriving within a short window; finish() flushes anything outstanding.
+        """
+        if not update:
+            return
+        with self._summary_cache_lock:
+            # Frameworks often re-emit unchanged values every epoch; skip the I/O
+            if update.items() <= self._summary_cache.items():
+                return
+            self._summary_cache.update(update)
+            self._summary_file_dirty = True
+            # Map summary fields to experiment record fields
+            for key in _SUMMARY_STORAGE_FIELDS:
+                if key in update:
+                    self._pending_storage_updates[key] = update[key]
+        self._schedule_summary_flush()
+
+    def _schedule_summary_flush(self) -> None:
+        if self._summary_flush_stop.is_set():
+            # Run already finished; nothing will flush in the background
+            self._flush_summary()
+            return
+        self._summary_dirty.set()
+        if self._summary_flush_thread is None:
+            with self._summary_cache_lock:
+                if self._summary_flush_thread is None:
+                    t = threading.Thread(
+                        target=self._summary_flush_worker, name="runicorn-summary", daemon=True
+                    )
+                    self._summary_flush_thread = t
+                    t.start()
+                    atexit.register(self._summary_flush_drain)
+
+    def _summary_flush_worker(self) -> None:
+        while True:
+            self._summary_dirty.wait()
+            # Let a burst of updates accumulate; returns early when stopping
+            stopping = self._summary_flush_stop.wait(_SUMMARY_FLUSH_INTERVAL_SEC)
+            self._summary_dirty.clear()
+            self._flush_summary()
+            if stopping:
+                return
+
+    def _summary_flush_drain(self, timeout: float = 10.0) -> None:
+        """Write any pending summary update and stop the flush thread."""
+        self._summary_flush_stop.set()
+        t = self._summary_flush_thread
+        if t is None:
+            return
+        with self._summary_cache_lock:
+            # Rewrite the compact live file once more, indented
+            self._summary_file_dirty = True
+        self._summary_dirty.set()
+        t.join(timeout=timeout)
+        self._summary_flush_thread = None
+        if self._summary_dirty.is_set() and not t.is_alive():
+            # An update raced with shutdown after the worker's last flush
+            self._flush_summary()
+        try:
+            atexit.unregister(self._summary_flush_drain)
+        except Exception:
+            pass
+
+    def _flush_summary(self) -> None:
+        with self._summary_cache_lock:
+            snapshot = dict(self._summary_cache) if self._summary_file_dirty else None
+            self._summary_file_dirty = False
+            # Everything queued this window (summary fields, new best metric)
+            # goes out as one update_experiment call
+            storage_updates = self._pending_storage_updates
+            self._pending_storage_updates = {}
+
+        # Update traditional summary.json file (always for compatibility).
+        # Written compact while the run is live; the final flush from
+        # finish() (and any later one) is indented for readability.
+        if snapshot is not None:
+            pretty = self._summary_flush_stop.is_set()
+            try:
+                with self._summary_lock:
+                    self._write_json_atomic(self._summary_path, snapshot, pretty=pretty)
+            except Exception as e:
+                logger.warning(f"Failed to write summary file: {e}")
+
         # Also update modern storage if available
-        if self.storage_backend:
+        if storage_updates and self.storage_backend:
+            # At most one update in flight per run: while the previous one is
+            # still running, this thread waits and new updates keep merging
+            # into _pending_storage_updates instead of queueing up
+            self._wait_storage_update()
             try:
-                import asyncio
-                # Map summary fields to experiment record fields
-                storage_updates = {}
-                if "best_metric_value" in update:
-                    storage_updates["best_metric_value"] = update["best_metric_value"]
-                if "best_metric_name" in update:
-                    storage_updates["best_metric_name"] = update["best_metric_name"]
-                if "best_metric_step" in update:
-                    storage_updates["best_metric_step"] = update["best_metric_step"]
-                if "best_metric_mode" in update:
-                    storage_updates["best_metric_mode"] = update["best_metric_mode"]
-                
-                if storage_updates:
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.create_task(self.storage_backend.update_experiment(self.id, storage_updates))
-                        else:
-                            loop.run_until_complete(self.storage_backend.update_experiment(self.id, storage_updates))
-                    except RuntimeError:
-                        asyncio.run(self.storage_backend.update_experiment(self.id, storage_updates))
-                        
+                from .storage.sync_utils import submit_async
+                self._storage_inflight = submit_async(
+                    self.storage_backend.update_experiment(self.id, storage_updates)
+                )
             except Exception as e:
                 logger.debug(f"Failed to update summary in modern storage: {e}")
 
+    def _wait_storage_update(self, timeout: float = 10.0) -> None:
+        fut = self._storage_inflight
+        if fut is None:
+            return
+        self._storage_inflight = None
+        try:
+            fut.result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Modern storage update failed: {e}")
+
     def _update_best_metric(self, payload: Dict[str, Any]) -> None:
         """Update the best metric value if primary metric is configured."""
-        if not self._primary_metric_name or self._primary_metric_name not in payload:
+        if not self._primary_metric_name:
             return
         
-        current_value = payload[self._primary_metric_name]
+        # Single lookup; a missing metric yields None and fails the type check below
+        current_value = payload.get(self._primary_metric_name)
         if not isinstance(current_value, (int, float)):
             return
         
-        # Check if this is a new best value
-        is_new_best = False
-        if self._best_metric_value is None:
-            is_new_best = True
-        elif self._primary_metric_mode == "max" and current_value > self._best_metric_value:
-            is_new_best = True
-        elif self._primary_metric_mode == "min" and current_value < self._best_metric_value:
-            is_new_best = True
-        
-        if is_new_best:
+        # Check if this is a new best value against a local snapshot; the
+        # common no-improvement case never takes the lock
+        best = self._best_metric_value
+        if best is not None and not self._is_better(current_value, best):
+            return
+        step = payload.get("global_step", payload.get("step"))
+        with self._best_lock:
+            # Re-check: another thread may have recorded a better value meanwhile
+            best = self._best_metric_value
+            if best is not None and not self._is_better(current_value, best):
+                return
             self._best_metric_value = current_value
-            self._best_metric_step = payload.get("global_step", payload.get("step"))
-            logger.debug(f"New best {self._primary_metric_name}: {current_value} at step {self._best_metric_step}")
-            
-            # Update modern storage with new best metric
-            if self.storage_backend:
-                try:
-                    import asyncio
-                    updates = {
-                        "best_metric_value": self._best_metric_value,
-                        "best_metric_name": self._primary_metric_name,
-                        "best_metric_step": self._best_metric_step,
-                        "best_metric_mode": self._primary_metric_mode
-                    }
-                    
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.create_task(self.storage_backend.update_experiment(self.id, updates))
-                        else:
-                            loop.run_until_complete(self.storage_backend.update_experiment(self.id, updates))
-                    except RuntimeError:
-                        asyncio.run(self.storage_backend.update_experiment(self.id, updates))
-                        
-                except Exception as e:
-                    logger.debug(f"Failed to update best metric in modern storage: {e}")
+            self._best_metric_step = step
+        logger.debug(f"New best {self._primary_metric_name}: {current_value} at step {step}")
+        
+        # Queue the new best for modern storage; the summary flush thread
+        # merges it with any other pending updates into one call
+        if self.storage_backend:
+            with self._summary_cache_lock:
+                self._pending_storage_updates.update(
+                    best_metric_value=current_value,
+                    best_metric_name=self._primary_metric_name,
+                    best_metric_step=step,
+                    best_metric_mode=self._primary_metric_mode,
+                )
+            self._schedule_summary_flush()
     
-    def finish(self, status: str = "finished") -> None:
-        """Mark the run as finished and ensure all data is written."""
+    def finish(self, status: str = "finished", *, archive_timeout: Optional[float] = None) -> None:
+        """Mark the run as finished and ensure all data is written.
+
+        Args:
+            status: Final run status
+            archive_timeout: Max seconds to wait for background dataset/pretrained
+                archives (None waits until they complete)
+        """
         # Stop console capture before finishing
         if self._console_capture is not None:
             try:
@@ -979,59 +1412,49 @@ class Run:
             self._console_capture = None
         
         self.stop_outputs_watch()
+        self._wait_archives(archive_timeout)
 
-        if self._index_db is not None:
-            try:
-                self._index_db.finish_run(run_id=self.id, status=status, ended_at=_now_ts())
-            except Exception:
-                pass
+        self._index_submit("finish_run", run_id=self.id, status=status, ended_at=_now_ts())
+        self._index_drain()
+        db = self._index_db
+        if db is not None:
             try:
-                if hasattr(self._index_db, "close_all"):
-                    self._index_db.close_all()
+                if hasattr(db, "close_all"):
+                    db.close_all()
                 else:
-                    self._index_db.close()
+                    db.close()
             except Exception:
                 pass
         # Save best metric to summary before finishing
-        if self._best_metric_value is not None:
+        with self._best_lock:
+            best_value, best_step = self._best_metric_value, self._best_metric_step
+        if best_value is not None:
             best_metric_summary = {
-                "best_metric_value": self._best_metric_value,
+                "best_metric_value": best_value,
                 "best_metric_name": self._primary_metric_name,
-                "best_metric_step": self._best_metric_step,
+                "best_metric_step": best_step,
                 "best_metric_mode": self._primary_metric_mode
             }
             self.summary(best_metric_summary)
+        self._summary_flush_drain()
         
         # Update status file (always for compatibility)
         with self._status_lock:
-            cur: Dict[str, Any] = {}
-            if self._status_path.exists():
-                try:
-                    cur = json.loads(self._status_path.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Failed to read status file: {e}, starting fresh")
-                    cur = {}
-            cur.update({"status": status, "ended_at": _now_ts()})
-            self._status_path.write_text(json.dumps(cur, ensure_ascii=False, indent=2), encoding="utf-8")
+            self._status_cache.update({"status": status, "ended_at": _now_ts()})
+            self._write_json_atomic(self._status_path, self._status_cache)
         
         # Also update modern storage if available
         if self.storage_backend:
             try:
-                import asyncio
+                from .storage.sync_utils import submit_async
                 updates = {
                     "status": status,
                     "ended_at": _now_ts()
                 }
-                
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(self.storage_backend.update_experiment(self.id, updates))
-                    else:
-                        loop.run_until_complete(self.storage_backend.update_experiment(self.id, updates))
-                except RuntimeError:
-                    asyncio.run(self.storage_backend.update_experiment(self.id, updates))
-                    
+                # Wait for the final update so the backend is idle before it is closed below
+                self._wait_storage_update()
+                update = self.storage_backend.update_experiment(self.id, updates)
+                submit_async(update).result(timeout=10.0)
             except Exception as e:
                 logger.debug(f"Failed to update status in modern storage: {e}")
             
@@ -1041,34 +1464,24 @@ class Run:
                     self.storage_backend.close()
                     logger.debug("Closed storage backend connections")
                     
-                    # Additional: Force close all file handles
-                    import gc
-                    gc.collect()  # Force garbage collection to release handles
-                    
-                    # Small delay for Windows to release file locks
-                    import time as time_module
-                    time_module.sleep(0.05)
+                    if os.name == "nt":
+                        # Force close all file handles
+                        gc.collect()  # Force garbage collection to release handles
+                        
+                        # Small delay for Windows to release file locks
+                        time.sleep(0.05)
                     
             except Exception as e:
                 logger.debug(f"Failed to close storage backend: {e}")
         
-        # Force flush to ensure data is written to disk
-        try:
-            import os
-            os.sync()  # Unix/Linux
-        except (AttributeError, OSError):
-            try:
-                import ctypes
-                # Windows fallback
-                kernel32 = ctypes.windll.kernel32
-                kernel32.FlushFileBuffers.argtypes = [ctypes.c_void_p]
-                kernel32.FlushFileBuffers.restype = ctypes.c_bool
-            except:
-                pass  # Best effort
+        # Flush this run's append-only event log to disk; summary.json and
+        # status.json are fsynced as part of their atomic writes
+        self._fsync_path(self._events_path)
                 
-        # Small delay to ensure file system catches up
-        import time
-        time.sleep(0.1)
+        # Small delay to ensure file system catches up (Windows only; POSIX
+        # renames and closes are visible immediately)
+        if os.name == "nt":
+            time.sleep(0.1)
 
     # ---------------- context manager -----------------
     def __enter__(self) -> "Run":
@@ -1081,17 +1494,174 @@ class Run:
         self.finish(status=status)
 
     # ---------------- helpers -----------------
+    def _index_submit(self, op: str, **kwargs: Any) -> None:
+        """Queue an IndexDb write for the background worker.
+
+        Once the worker has been drained (``finish()`` or interpreter exit)
+        writes are applied synchronously instead.
+        """
+        if self._index_db_failed:
+            return
+        with self._index_thread_lock:
+            if not self._index_stopped:
+                self._index_queue.put((op, kwargs))
+                if self._index_thread is None:
+                    t = threading.Thread(
+                        target=self._index_worker, name="runicorn-index", daemon=True
+                    )
+                    self._index_thread = t
+                    t.start()
+                    atexit.register(self._index_drain)
+                return
+        self._index_write_now(op, kwargs)
+
+    def _index_write_now(self, op: str, kwargs: Dict[str, Any]) -> None:
+        """Apply a single IndexDb write in the calling thread."""
+        db = self._open_index_db()
+        if db is None:
+            return
+        try:
+            getattr(db, op)(**kwargs)
+        except Exception as e:
+            logger.debug(f"Index write '{op}' failed: {e}")
+        finally:
+            try:
+                db.close()
+            except Exception:
+                pass
+
+    def _open_index_db(self) -> Optional[IndexDb]:
+        if self._index_db is None and not self._index_db_failed:
+            try:
+                self._index_db = IndexDb(self.storage_root)
+            except Exception as e:
+                self._index_db_failed = True
+                logger.debug(f"Failed to open index db: {e}")
+        return self._index_db
+
+    def _index_worker(self) -> None:
+        db = self._open_index_db()
+        q = self._index_queue
+        while True:
+            # Collect up to one window's worth of ops; None is the stop sentinel
+            batch = [q.get()]
+            deadline = time.monotonic() + _INDEX_FLUSH_INTERVAL_SEC
+            while batch[-1] is not None and len(batch) < _INDEX_BATCH_MAX_OPS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+            if batch and db is not None:
+                try:
+                    with db.batch():
+                        for op, kwargs in batch:
+                            try:
+                                getattr(db, op)(**kwargs)
+                            except Exception as e:
+                                logger.debug(f"Index write '{op}' failed: {e}")
+                except Exception as e:
+                    logger.debug(f"Index batch failed: {e}")
+            if stop:
+                return
+
+    def _index_drain(self, timeout: float = 10.0) -> None:
+        """Flush queued index writes and stop the worker.
+
+        Later submits are written synchronously, so nothing is queued for a
+        worker that will never run again.
+        """
+        with self._index_thread_lock:
+            self._index_stopped = True
+            t = self._index_thread
+        if t is None:
+            return
+        # Every queued op was put under the lock, so the sentinel comes last
+        self._index_queue.put(None)
+        t.join(timeout=timeout)
+        self._index_thread = None
+        try:
+            atexit.unregister(self._index_drain)
+        except Exception:
+            pass
+
     @staticmethod
     def _write_json(path: Path, obj: Dict[str, Any]) -> None:
         os.makedirs(path.parent, exist_ok=True)
-        path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(_dumps(obj))
+
+    @staticmethod
+    def _write_json_atomic(path: Path, obj: Dict[str, Any], pretty: bool = True) -> None:
+        """Write JSON via a temp file + rename so readers never see a partial file.
+
+        Callers hold the file's FileLock, so a fixed sibling temp name is safe.
+        """
+        # Encode up front so the payload goes out in a single write()
+        data = memoryview(_dumps(obj, pretty))
+        tmp_path = f"{os.fspath(path)}.tmp"
+        fd = os.open(tmp_path, _ATOMIC_WRITE_FLAGS, 0o666)
+        try:
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _fsync_path(path: Path) -> None:
+        try:
+            fd = os.open(path, os.O_RDONLY if os.name != "nt" else os.O_RDWR)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.debug(f"fsync failed for {path}: {e}")
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _read_json_or_empty(path: Path) -> Dict[str, Any]:
+        try:
+            data = _loads(path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (ValueError, IOError) as e:
+            logger.warning(f"Failed to read {path.name}: {e}, starting fresh")
+            return {}
+        return data if isinstance(data, dict) else {}
     
     @staticmethod
     def _append_jsonl(path: Path, obj: Dict[str, Any], lock: FileLock) -> None:
+        Run._append_jsonl_many(path, (obj,), lock)
+
+    @staticmethod
+    def _append_jsonl_many(path: Path, objs: Iterable[Dict[str, Any]], lock: FileLock) -> None:
+        """Append several JSON lines with one buffer and a single write."""
+        buf = bytearray()
+        extend = buf.extend
+        for obj in objs:
+            extend(_json_encode(obj).encode("utf-8"))
+            extend(b"\n")
+        if not buf:
+            return
         os.makedirs(path.parent, exist_ok=True)
         with lock:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            with open(path, "ab") as f:
+                f.write(buf)
 
 
 # --------------- module-level API ---------------
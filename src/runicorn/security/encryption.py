@@ -5,6 +5,7 @@ Uses Fernet symmetric encryption with a user-specific key.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -12,10 +13,20 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-# Lazy import to avoid dependency issues if cryptography not installed
+# Optional: cryptography is only needed once a password is encrypted/decrypted
+try:
+    from cryptography.fernet import Fernet  # type: ignore
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    Fernet = None  # type: ignore
+    HAS_CRYPTOGRAPHY = False
+
 _fernet_instance: Optional[object] = None
 
+_FERNET_PREFIX = "gAAAAA"
+
 
+@functools.lru_cache(maxsize=1)
 def _get_key_path() -> Path:
     """Get path to encryption key file."""
     from ..config import _config_root_dir
@@ -37,7 +48,8 @@ def _ensure_key() -> bytes:
             return key_path.read_bytes()
         
         # Generate new key
-        from cryptography.fernet import Fernet
+        if not HAS_CRYPTOGRAPHY:
+            raise RuntimeError("cryptography library required for password encryption")
         key = Fernet.generate_key()
         
         # Save key with restricted permissions
@@ -61,13 +73,10 @@ def _get_cipher():
     global _fernet_instance
     
     if _fernet_instance is None:
-        try:
-            from cryptography.fernet import Fernet
-            key = _ensure_key()
-            _fernet_instance = Fernet(key)
-        except ImportError:
+        if not HAS_CRYPTOGRAPHY:
             logger.error("cryptography library not installed. Cannot encrypt passwords.")
             raise RuntimeError("cryptography library required for password encryption")
+        _fernet_instance = Fernet(_ensure_key())
     
     return _fernet_instance
 
@@ -126,12 +135,6 @@ def is_encrypted(value: str) -> bool:
     Returns:
         True if value looks like encrypted data
     """
-    if not value:
-        return False
-    
     # Fernet tokens start with 'gAAAAA' (base64 of version byte + timestamp)
     # This is a heuristic check
-    try:
-        return value.startswith('gAAAAA') and len(value) > 50
-    except:
-        return False
+    return isinstance(value, str) and len(value) > 50 and value[:6] == _FERNET_PREFIX
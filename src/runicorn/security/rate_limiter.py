@@ -190,7 +190,7 @@ class EndpointRateLimiter:
             Tuple of (is_allowed, retry_after_seconds)
         """
         # Check if rate limiting is enabled
-        if not self._settings.get("enable_rate_limiting", True):
+        if not self.is_enabled():
             return True, None
         
         # Check if localhost should be whitelisted
@@ -206,6 +206,10 @@ class EndpointRateLimiter:
         
         return allowed, retry_after
     
+    def is_enabled(self) -> bool:
+        """Whether rate limiting is currently enabled."""
+        return bool(self._settings.get("enable_rate_limiting", True))
+    
     def get_settings(self) -> Dict[str, Any]:
         """Get current rate limiter settings."""
         return self._settings.copy()
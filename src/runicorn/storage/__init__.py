@@ -26,6 +26,7 @@ from .file_utils import (
     soft_delete_run,
     restore_run,
     iter_all_runs,
+    list_all_runs,
     find_run_dir_by_id,
     periodic_status_check
 )
@@ -53,6 +54,7 @@ __all__ = [
     "soft_delete_run",
     "restore_run",
     "iter_all_runs",
+    "list_all_runs",
     "find_run_dir_by_id",
     "periodic_status_check"
 ]
@@ -7,19 +7,56 @@ These utilities are used by both the storage backends and the viewer services.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
+import threading
 import time
 import psutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from ..sdk import DEFAULT_DIRNAME, _default_storage_dir
+from ..index import IndexDb
+from ..sdk import DEFAULT_DIRNAME, _default_storage_dir, _dumps, _loads
 
 logger = logging.getLogger(__name__)
 
+# Top-level dirs in the storage root that never hold legacy project runs
+_NON_PROJECT_DIRS = frozenset({"runs", "webui", "archive", "index"})
+
+# Shared pool for scanning independent subtrees; run discovery is I/O bound
+_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+_scan_pool: Optional[ThreadPoolExecutor] = None
+_scan_pool_lock = threading.Lock()
+
+
+def _reset_scan_pool() -> None:
+    # Worker threads do not survive fork(); let the child start its own pool
+    global _scan_pool
+    _scan_pool = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_scan_pool)
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    global _scan_pool
+    pool = _scan_pool
+    if pool is None:
+        with _scan_pool_lock:
+            pool = _scan_pool
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=_SCAN_WORKERS,
+                    thread_name_prefix="runicorn-scan",
+                )
+                _scan_pool = pool
+    return pool
+
 
 @dataclass
 class RunEntry:
@@ -45,6 +82,14 @@ class RunEntry:
         return parts[-1] if parts else None
 
 
+# run_id -> RunEntry per storage root, extended whenever a lookup misses
+_run_index: Dict[Path, Dict[str, RunEntry]] = {}
+_run_index_lock = threading.Lock()
+
+# Index DB handles per storage root, opened on first lookup
+_index_dbs: Dict[Path, IndexDb] = {}
+
+
 def get_storage_root(storage: Optional[str] = None) -> Path:
     """
     Get the storage root directory and ensure it exists.
@@ -72,9 +117,9 @@ def read_json(path: Path) -> Dict[str, Any]:
         Dictionary with file contents, empty dict if file doesn't exist or is invalid
     """
     try:
-        if not path.exists():
-            return {}
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         logger.debug(f"Failed to read JSON file {path}: {e}")
         return {}
@@ -84,6 +129,9 @@ def write_json(path: Path, data: Dict[str, Any]) -> bool:
     """
     Safely write data to a JSON file.
     
+    The data is written to a sibling temp file and renamed into place, so
+    concurrent readers never see a partially written file.
+    
     Args:
         path: Path to JSON file
         data: Data to write
@@ -91,14 +139,18 @@ def write_json(path: Path, data: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Unique per writer so concurrent writes to the same file can't collide
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        tmp_path.write_bytes(_dumps(data))
+        os.replace(tmp_path, path)
         return True
     except Exception as e:
         logger.error(f"Failed to write JSON file {path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 
@@ -115,6 +167,20 @@ def is_process_alive(pid: Optional[int]) -> bool:
     if pid is None:
         return False
     
+    if os.name == "posix" and isinstance(pid, int) and pid > 0:
+        # Signal 0 only checks for existence: one syscall, no psutil overhead
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Exists, but belongs to another user
+            return True
+        except OSError:
+            pass
+        else:
+            return True
+    
     try:
         return psutil.pid_exists(pid)
     except Exception:
@@ -134,7 +200,25 @@ def is_process_alive(pid: Optional[int]) -> bool:
             return False
 
 
-def update_status_if_process_dead(run_dir: Path) -> None:
+def live_pids() -> Set[int]:
+    """
+    Snapshot the PIDs of all running processes.
+    
+    On Linux this is a single listing of /proc; elsewhere psutil is used.
+    
+    Returns:
+        Set of process IDs
+    """
+    if os.name == "posix" and os.path.isdir("/proc"):
+        return {int(name) for name in os.listdir("/proc") if name.isdigit()}
+    return set(psutil.pids())
+
+
+def update_status_if_process_dead(
+    run_dir: Path, 
+    pid_snapshot: Optional[Set[int]] = None, 
+    status: Optional[Dict[str, Any]] = None
+) -> None:
     """
     Update run status to 'failed' if the process is no longer running.
     
@@ -142,6 +226,9 @@ def update_status_if_process_dead(run_dir: Path) -> None:
     
     Args:
         run_dir: Path to the run directory
+        pid_snapshot: Optional snapshot of running PIDs (see live_pids());
+            PIDs found in it skip the per-process liveness query
+        status: Already parsed status.json contents, to avoid reading it again
     """
     try:
         meta_path = run_dir / "meta.json"
@@ -151,7 +238,7 @@ def update_status_if_process_dead(run_dir: Path) -> None:
             return
         
         meta = read_json(meta_path)
-        status = read_json(status_path)
+        status = dict(status) if status is not None else read_json(status_path)
         
         # Only check if status is currently "running"
         if status.get("status") != "running":
@@ -184,7 +271,10 @@ def update_status_if_process_dead(run_dir: Path) -> None:
             return
         
         pid = meta.get("pid")
-        if pid and not is_process_alive(pid):
+        # A PID missing from the snapshot may belong to a process started
+        # after it was taken, so confirm before marking the run failed
+        in_snapshot = pid_snapshot is not None and pid in pid_snapshot
+        if pid and not in_snapshot and not is_process_alive(pid):
             # Process is dead, mark as failed
             status.update({
                 "status": "failed",
@@ -271,102 +361,221 @@ def list_run_dirs_legacy(root: Path) -> List[Path]:
     runs_dir = root / "runs"
     if not runs_dir.exists():
         return []
-    return sorted(
-        [p for p in runs_dir.iterdir() if p.is_dir()], 
-        key=lambda p: p.stat().st_mtime, 
-        reverse=True
-    )
+    return [Path(e.path) for e in _subdirs_newest_first(runs_dir)]
+
+
+def _subdirs_newest_first(path: Any) -> List[os.DirEntry]:
+    """List subdirectories of ``path`` by modification time, newest first."""
+    keyed = []
+    with os.scandir(path) as it:
+        for e in it:
+            try:
+                # Stat each entry once up front rather than inside the sort key
+                if e.is_dir():
+                    keyed.append((e.stat().st_mtime, e))
+            except OSError:
+                continue
+    keyed.sort(key=lambda item: item[0], reverse=True)
+    return [e for _, e in keyed]
 
 
-def iter_all_runs(root: Path, include_deleted: bool = False) -> List[RunEntry]:
+def iter_all_runs(root: Path, include_deleted: bool = False) -> Iterator[RunEntry]:
     """
     Discover runs in both new and legacy layouts.
     
     New layout:   root/runs/<path>/<run_id>
     Legacy layout: root/<project>/<name>/runs/<run_id>
     
+    Top-level subtrees are scanned on a shared thread pool, at most one
+    pool's worth ahead of the consumer; results are yielded in the same
+    order a sequential walk would produce. Closing the generator early
+    cancels queued scans and stops running ones at their next run, so
+    callers that stop early skip the rest. Use list_all_runs() to get a list.
+    
     Args:
         root: Storage root directory
         include_deleted: Whether to include soft-deleted runs
         
-    Returns:
-        List of run entries
+    Yields:
+        Run entries
     """
-    entries: List[RunEntry] = []
+    # One zero-arg callable per subtree, in the order results are yielded
+    scans: List[Callable[[], Iterable[RunEntry]]] = []
     
     # New layout: root/runs/<path>/<run_id>
     runs_root = root / "runs"
     if runs_root.exists():
         try:
-            entries.extend(_scan_runs_recursive(runs_root, "", include_deleted))
+            for child in _sorted_subdirs(runs_root):
+                scans.append(partial(
+                    _walk_run_candidates, [(child.path, child.name, "")], include_deleted
+                ))
         except Exception as e:
             logger.debug(f"Error scanning new layout: {e}")
     
     # Legacy layout: root/<project>/<name>/runs/<run_id>
     try:
-        for proj in sorted([p for p in root.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
+        for proj in _sorted_subdirs(root):
             # Skip well-known non-project dirs
-            if proj.name in {"runs", "webui", "archive", "index"}:
+            if proj.name in _NON_PROJECT_DIRS:
                 continue
-            for name in sorted([n for n in proj.iterdir() if n.is_dir()], key=lambda p: p.name.lower()):
-                runs_dir = name / "runs"
-                if not runs_dir.exists():
-                    continue
-                for rd in sorted([p for p in runs_dir.iterdir() if p.is_dir()], 
-                                key=lambda p: p.stat().st_mtime, reverse=True):
-                    # Filter out soft-deleted runs unless explicitly requested
-                    if not include_deleted and is_run_deleted(rd):
-                        continue
-                    # Convert legacy project/name to path
-                    legacy_path = f"{proj.name}/{name.name}"
-                    entries.append(RunEntry(path=legacy_path, dir=rd))
+            for name in _sorted_subdirs(proj.path):
+                # Convert legacy project/name to path
+                legacy_path = f"{proj.name}/{name.name}"
+                scans.append(partial(
+                    _scan_legacy_runs, Path(name.path) / "runs", legacy_path, include_deleted
+                ))
     except Exception as e:
         logger.debug(f"Error scanning legacy layout: {e}")
     
-    return entries
+    if len(scans) > 1:
+        yield from _run_scans(scans)
+    else:
+        for scan in scans:
+            yield from scan()
 
 
-def _scan_runs_recursive(
-    current_dir: Path, 
-    current_path: str, 
-    include_deleted: bool
-) -> List[RunEntry]:
-    """
-    Recursively scan for run directories.
+def _run_scans(scans: List[Callable[[], Iterable[RunEntry]]]) -> Iterator[RunEntry]:
+    """Run scans on the pool with a bounded look-ahead, yielding in order."""
+    pool = _get_scan_pool()
+    stop = threading.Event()
     
-    A directory is considered a run if it contains meta.json or status.json.
-    Otherwise, it's treated as a path segment.
+    def collect(scan: Callable[[], Iterable[RunEntry]]) -> List[RunEntry]:
+        entries = []
+        for entry in scan():
+            if stop.is_set():
+                break
+            entries.append(entry)
+        return entries
+    
+    pending: "deque[Future[List[RunEntry]]]" = deque()
+    todo = iter(scans)
+    
+    def submit_next() -> None:
+        scan = next(todo, None)
+        if scan is not None:
+            pending.append(pool.submit(collect, scan))
+    
+    try:
+        for _ in range(_SCAN_WORKERS):
+            submit_next()
+        while pending:
+            result = pending.popleft().result()
+            # Keep the window full before handing results to the consumer
+            submit_next()
+            yield from result
+    finally:
+        stop.set()
+        for future in pending:
+            future.cancel()
+
+
+def list_all_runs(root: Path, include_deleted: bool = False) -> List[RunEntry]:
     """
-    entries: List[RunEntry] = []
+    Discover runs like iter_all_runs(), returning them as a list.
     
+    Args:
+        root: Storage root directory
+        include_deleted: Whether to include soft-deleted runs
+        
+    Returns:
+        List of run entries
+    """
+    return list(iter_all_runs(root, include_deleted=include_deleted))
+
+
+def _sorted_subdirs(path: Any) -> List[os.DirEntry]:
+    """List subdirectories of ``path`` sorted case-insensitively by name."""
+    with os.scandir(path) as it:
+        return sorted((e for e in it if e.is_dir()), key=lambda e: e.name.lower())
+
+
+def _is_run_dir(path: str) -> bool:
+    """A directory is a run if it contains meta.json or status.json."""
+    return (
+        os.path.exists(os.path.join(path, "meta.json"))
+        or os.path.exists(os.path.join(path, "status.json"))
+    )
+
+
+def _is_deleted_dir(path: str) -> bool:
+    return os.path.exists(os.path.join(path, ".deleted"))
+
+
+def _scan_legacy_runs(
+    runs_dir: Path, 
+    legacy_path: str, 
+    include_deleted: bool
+) -> Iterator[RunEntry]:
+    """Yield runs of one legacy project/name pair, newest first."""
+    if not runs_dir.exists():
+        return
     try:
-        for item in sorted(current_dir.iterdir(), key=lambda p: p.name.lower()):
-            if not item.is_dir():
-                continue
-            
-            # Check if this is a run directory (has meta.json or status.json)
-            is_run = (item / "meta.json").exists() or (item / "status.json").exists()
-            
-            if is_run:
-                # Filter out soft-deleted runs unless explicitly requested
-                if not include_deleted and is_run_deleted(item):
-                    continue
-                # This is a run directory
-                entries.append(RunEntry(path=current_path or None, dir=item))
-            else:
-                # This is a path segment, recurse
-                new_path = f"{current_path}/{item.name}" if current_path else item.name
-                entries.extend(_scan_runs_recursive(item, new_path, include_deleted))
+        run_dirs = _subdirs_newest_first(runs_dir)
     except Exception as e:
-        logger.debug(f"Error scanning {current_dir}: {e}")
+        logger.debug(f"Error scanning legacy runs in {runs_dir}: {e}")
+        return
+    for rd in run_dirs:
+        # Filter out soft-deleted runs unless explicitly requested
+        if not include_deleted and _is_deleted_dir(rd.path):
+            continue
+        yield RunEntry(path=legacy_path, dir=Path(rd.path))
+
+
+def _list_dir(path: str) -> Tuple[Set[str], List[os.DirEntry]]:
+    """List a directory once, returning its entry names and subdirectories."""
+    with os.scandir(path) as it:
+        entries = list(it)
+    return {e.name for e in entries}, [e for e in entries if e.is_dir()]
+
+
+def _walk_run_candidates(
+    candidates: List[Tuple[str, str, str]], 
+    include_deleted: bool
+) -> Iterator[RunEntry]:
+    """
+    Yield run directories among ``candidates`` and their descendants.
+    
+    Each candidate is ``(dir path, dir name, logical path of its parent)``.
+    A directory is considered a run if it contains meta.json or status.json.
+    Otherwise, it's treated as a path segment and descended into.
     
-    return entries
+    Every directory is listed exactly once with ``os.scandir``: the entry
+    names answer whether it is a run and whether it's soft-deleted, and the
+    subdirectories from the same listing become the next candidates. The walk
+    uses an explicit stack so deep hierarchies can't hit the recursion limit.
+    """
+    # Pushed in reverse so siblings pop in name order (depth-first walk)
+    stack = list(reversed(candidates))
+    while stack:
+        dir_path, name, parent = stack.pop()
+        try:
+            names, subdirs = _list_dir(dir_path)
+        except Exception as e:
+            logger.debug(f"Error scanning {dir_path}: {e}")
+            continue
+        
+        if "meta.json" in names or "status.json" in names:
+            # Filter out soft-deleted runs unless explicitly requested
+            if include_deleted or ".deleted" not in names:
+                yield RunEntry(path=parent or None, dir=Path(dir_path))
+            continue
+        
+        # This is a path segment, descend
+        path = f"{parent}/{name}" if parent else name
+        subdirs.sort(key=lambda e: e.name.lower())
+        stack.extend((e.path, e.name, path) for e in reversed(subdirs))
 
 
 def find_run_dir_by_id(root: Path, run_id: str, include_deleted: bool = False) -> Optional[RunEntry]:
     """
     Find a run directory by its ID.
     
+    Lookups are served from an in-memory index of earlier scans when the
+    cached directory still exists. Otherwise the run directory recorded by
+    the SDK in the index DB is tried, and only then is the tree walked until
+    the run turns up, indexing every run seen on the way.
+    
     Args:
         root: Storage root directory
         run_id: Run ID to search for
@@ -375,10 +584,118 @@ def find_run_dir_by_id(root: Path, run_id: str, include_deleted: bool = False) -
     Returns:
         RunEntry if found, None otherwise
     """
-    for entry in iter_all_runs(root, include_deleted=include_deleted):
-        if entry.dir.name == run_id:
+    with _run_index_lock:
+        entry = _run_index.get(root, {}).get(run_id)
+    if entry is not None and entry.dir.is_dir():
+        if include_deleted or not is_run_deleted(entry.dir):
             return entry
-    return None
+    
+    entry = _lookup_run_in_index_db(root, run_id)
+    if entry is not None and (include_deleted or not is_run_deleted(entry.dir)):
+        with _run_index_lock:
+            _run_index.setdefault(root, {})[run_id] = entry
+        return entry
+    
+    index: Dict[str, RunEntry] = {}
+    found: Optional[RunEntry] = None
+    for entry in iter_all_runs(root, include_deleted=True):
+        index.setdefault(entry.dir.name, entry)
+        if entry.dir.name == run_id and (include_deleted or not is_run_deleted(entry.dir)):
+            found = entry
+            break
+    with _run_index_lock:
+        _run_index.setdefault(root, {}).update(index)
+    return found
+
+
+def _lookup_run_in_index_db(root: Path, run_id: str) -> Optional[RunEntry]:
+    """
+    Resolve a run through the index DB the SDK maintains, if one exists.
+    
+    Only runs recorded under root/runs are returned, and only while their
+    directory still looks like a run; anything else falls back to a walk.
+    """
+    if not (root / "index" / "runicorn.db").exists():
+        return None
+    try:
+        with _run_index_lock:
+            db = _index_dbs.get(root)
+            if db is None:
+                db = _index_dbs[root] = IndexDb(root)
+        row = db.get_run(run_id)
+    except Exception as e:
+        logger.debug(f"Index DB lookup failed for run {run_id}: {e}")
+        return None
+    if not row or not row.get("run_dir"):
+        return None
+    
+    # Rebuild the entry relative to root so it matches what a walk yields
+    run_dir = Path(row["run_dir"])
+    runs_root = root / "runs"
+    for base in (runs_root, runs_root.resolve()):
+        try:
+            rel = run_dir.relative_to(base)
+            break
+        except ValueError:
+            continue
+    else:
+        return None
+    if rel.name != run_id:
+        return None
+    run_dir = runs_root / rel
+    if not _is_run_dir(os.fspath(run_dir)):
+        return None
+    path = rel.parent.as_posix()
+    return RunEntry(path=None if path == "." else path, dir=run_dir)
+
+
+def _check_running_runs(
+    root: Path, 
+    status_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]]
+) -> Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]]:
+    """
+    Run one status-check pass over all runs.
+    
+    Args:
+        root: Storage root directory
+        status_cache: Cache returned by the previous pass, mapping run dir to
+            ((mtime_ns, size) of status.json, parsed status)
+        
+    Returns:
+        Cache to pass to the next pass
+    """
+    # One process table snapshot per pass instead of a query per run
+    try:
+        pids: Optional[Set[int]] = live_pids()
+    except Exception:
+        pids = None
+    
+    # Check all running experiments
+    seen: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    for entry in iter_all_runs(root):
+        try:
+            status_path = entry.dir / "status.json"
+            try:
+                st = status_path.stat()
+            except FileNotFoundError:
+                continue
+            # Only re-parse status.json when it changed since last pass;
+            # size guards against coarse mtime resolution
+            key = (st.st_mtime_ns, st.st_size)
+            cached = status_cache.get(entry.dir)
+            if cached is not None and cached[0] == key:
+                status = cached[1]
+            else:
+                status = read_json(status_path)
+            seen[entry.dir] = (key, status)
+            
+            if status.get("status") == "running":
+                update_status_if_process_dead(entry.dir, pid_snapshot=pids, status=status)
+        except Exception as entry_error:
+            # Don't let one bad entry crash the whole checker
+            logger.debug(f"Error checking status for {entry.dir.name}: {entry_error}")
+            continue
+    return seen
 
 
 async def periodic_status_check(root: Path) -> None:
@@ -386,22 +703,17 @@ async def periodic_status_check(root: Path) -> None:
     Periodically check and update status of running experiments.
     
     This runs as a background task to detect crashed/interrupted experiments.
+    Each pass runs in a worker thread so the file system scan doesn't block
+    the event loop.
     
     Args:
         root: Storage root directory
     """
+    status_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    
     while True:
         try:
-            # Check all running experiments
-            for entry in iter_all_runs(root):
-                try:
-                    status = read_json(entry.dir / "status.json")
-                    if status.get("status") == "running":
-                        update_status_if_process_dead(entry.dir)
-                except Exception as entry_error:
-                    # Don't let one bad entry crash the whole checker
-                    logger.debug(f"Error checking status for {entry.dir.name}: {entry_error}")
-                    continue
+            status_cache = await asyncio.to_thread(_check_running_runs, root, status_cache)
             
             # Wait 60 seconds before next check (reduced frequency to minimize log noise)
             await asyncio.sleep(60)
@@ -7,20 +7,60 @@ event loop issues in synchronous contexts like SDK initialization.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
+import os
+import threading
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Shared event loop for fire-and-forget storage updates, started on first use
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _reset_background_loop() -> None:
+    # The loop thread does not survive fork(); let the child start its own
+    global _bg_loop
+    _bg_loop = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_background_loop)
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _bg_loop
+    loop = _bg_loop
+    if loop is None:
+        with _bg_loop_lock:
+            loop = _bg_loop
+            if loop is None:
+                loop = asyncio.new_event_loop()
+                t = threading.Thread(target=loop.run_forever, name="runicorn-async", daemon=True)
+                t.start()
+                _bg_loop = loop
+    return loop
+
+
+def submit_async(coro) -> concurrent.futures.Future:
+    """
+    Schedule a coroutine on the shared background event loop.
+    
+    Returns immediately; call ``result()`` on the returned future to wait
+    for completion.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+
 
 def run_async_safe(coro):
     """
     Safely run an async coroutine in a synchronous context.
     
     This handles various event loop scenarios:
-    1. No event loop: Create a new one
-    2. Event loop exists but not running: Use it
-    3. Event loop running: Cannot run synchronously (returns None and logs warning)
+    1. No running loop in this thread: run on the shared background loop and wait
+    2. Event loop running: Cannot run synchronously (returns None and logs warning)
     
     Args:
         coro: Async coroutine to run
@@ -29,25 +69,16 @@ def run_async_safe(coro):
         Result of the coroutine, or None if cannot run synchronously
     """
     try:
-        # Try to get existing event loop
-        try:
-            loop = asyncio.get_running_loop()
+        # _get_running_loop() returns None instead of raising, keeping the
+        # common (no loop) case free of exception handling
+        if asyncio._get_running_loop() is not None:
             # We're already in an async context, cannot run synchronously
             logger.warning("Cannot run async operation synchronously within running event loop")
+            coro.close()
             return None
-        except RuntimeError:
-            # No running loop, safe to proceed
-            pass
         
-        # Create new event loop and run
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(coro)
-            return result
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
+        # Reuse the background loop instead of creating a loop per call
+        return submit_async(coro).result()
             
     except Exception as e:
         logger.error(f"Failed to run async operation synchronously: {e}")
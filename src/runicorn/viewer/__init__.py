@@ -8,16 +8,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Coroutine, Dict, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .utils.logging import setup_logging
 from .middleware.rate_limit import RateLimitMiddleware
 from .services.storage import get_storage_root, periodic_status_check
+from .api.listdir_cache import RateLimitedError, periodic_cache_cleanup
 from .api import (
     health_router,
     runs_router, 
@@ -39,6 +45,26 @@ from .. import __version__
 
 logger = logging.getLogger(__name__)
 
+# API routers and their OpenAPI tags, all mounted under /api
+_API_ROUTERS = [
+    (health_router, "health"),
+    (runs_router, "runs"),
+    (metrics_router, "metrics"),
+    (config_router, "config"),
+    (experiments_router, "experiments"),
+    (export_router, "export"),
+    (projects_router, "projects"),
+    (gpu_router, "gpu"),
+    (system_router, "system"),
+    (storage_router, "storage"),
+    (import_router, "import"),
+    (ui_preferences_router, "ui-preferences"),
+    (remote_router, "remote"),
+]
+
+# Origins allowed cross-origin access: localhost / loopback on any port
+_LOCAL_ORIGIN_REGEX = r"https?://(localhost|127\.0\.0\.1|\[::1\])(:\d+)?"
+
 
 def create_app(storage: Optional[str] = None) -> FastAPI:
     """
@@ -56,91 +82,97 @@ def create_app(storage: Optional[str] = None) -> FastAPI:
     # Setup logging
     setup_logging()
     
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Run background tasks while the app is up and clean up on shutdown."""
+        # Every background task is tracked here so shutdown can cancel them all
+        app.state.bg_tasks = set()
+        
+        # Background task for status checking
+        _spawn(app, periodic_status_check(root))
+        logger.info("Started background process status checker")
+        
+        # Background task for expiring cached remote listdir results
+        _spawn(app, periodic_cache_cleanup())
+        try:
+            yield
+        finally:
+            # Stop background tasks (status checker included)
+            tasks = list(app.state.bg_tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"Stopped {len(tasks)} background task(s)")
+            
+            # Close Remote Viewer sessions
+            if hasattr(app.state, 'viewer_manager'):
+                try:
+                    sessions = app.state.viewer_manager.list_sessions()
+                    for session in sessions:
+                        app.state.viewer_manager.stop_remote_viewer(session.session_id)
+                    logger.info("Closed all Remote Viewer sessions")
+                except Exception as e:
+                    logger.warning(f"Failed to close Remote Viewer sessions: {e}")
+            
+            # Close SSH connection pool
+            if hasattr(app.state, 'connection_pool'):
+                try:
+                    app.state.connection_pool.close_all()
+                    logger.info("Closed all SSH connections")
+                except Exception as e:
+                    logger.warning(f"Failed to close SSH connections: {e}")
+            
+            # Shut down the SSH listdir thread pool
+            try:
+                from .api.listdir_cache import close_global_rate_limiter
+                close_global_rate_limiter()
+            except Exception as e:
+                logger.warning(f"Failed to close listdir thread pool: {e}")
+            
+            # Close storage service (CRITICAL for Windows desktop app)
+            try:
+                from .services.modern_storage import close_storage_service
+                close_storage_service()
+                logger.info("Closed storage service and database connections")
+            except Exception as e:
+                logger.warning(f"Failed to close storage service: {e}")
+    
+    # The desktop shell never shows the interactive API docs, so skip
+    # building the OpenAPI schema there
+    docs_kwargs: Dict[str, Any] = {}
+    if os.environ.get("RUNICORN_DESKTOP", "").lower() in ("1", "true", "yes"):
+        docs_kwargs = {"openapi_url": None, "docs_url": None, "redoc_url": None}
+    
     # Create FastAPI app
     app = FastAPI(
         title="Runicorn Viewer",
         version=__version__,
-        description="Local experiment tracking and visualization platform"
+        description="Local experiment tracking and visualization platform",
+        lifespan=lifespan,
+        **docs_kwargs,
     )
     
-    # Configure CORS
+    # Configure CORS: the bundled UI and desktop shell are same-origin, so
+    # only local dev servers (e.g. Vite on :5173) need cross-origin access.
+    # Preflights are cached for a day to spare the SPA the extra round-trip.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*", "http://localhost:5173", "http://127.0.0.1:5173"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origin_regex=_LOCAL_ORIGIN_REGEX,
+        allow_credentials=False,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
+        max_age=86400,
     )
     
     # Add rate limiting middleware
     app.add_middleware(RateLimitMiddleware)
     
-    # Background task for status checking
-    _status_check_task = None
-    
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize background tasks on app startup."""
-        nonlocal _status_check_task
-        _status_check_task = asyncio.create_task(periodic_status_check(root))
-        logger.info("Started background process status checker")
+    # Turn rate-limited remote listdirs into 429s the frontend can back off on
+    app.add_exception_handler(RateLimitedError, _rate_limited_handler)
     
-    @app.on_event("shutdown") 
-    async def shutdown_event():
-        """Cleanup background tasks and connections on app shutdown."""
-        # Stop background status checker
-        if _status_check_task:
-            _status_check_task.cancel()
-            try:
-                await _status_check_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("Stopped background process status checker")
-        
-        # Close Remote Viewer sessions
-        if hasattr(app.state, 'viewer_manager'):
-            try:
-                sessions = app.state.viewer_manager.list_sessions()
-                for session in sessions:
-                    app.state.viewer_manager.stop_remote_viewer(session.session_id)
-                logger.info("Closed all Remote Viewer sessions")
-            except Exception as e:
-                logger.warning(f"Failed to close Remote Viewer sessions: {e}")
-        
-        # Close SSH connection pool
-        if hasattr(app.state, 'connection_pool'):
-            try:
-                app.state.connection_pool.close_all()
-                logger.info("Closed all SSH connections")
-            except Exception as e:
-                logger.warning(f"Failed to close SSH connections: {e}")
-        
-        # Close storage service (CRITICAL for Windows desktop app)
-        try:
-            from .services.modern_storage import close_storage_service
-            close_storage_service()
-            logger.info("Closed storage service and database connections")
-        except Exception as e:
-            logger.warning(f"Failed to close storage service: {e}")
-    
-    # Register v1 API routers (backward compatibility)
-    app.include_router(health_router, prefix="/api", tags=["health"])
-    app.include_router(runs_router, prefix="/api", tags=["runs"])
-    app.include_router(metrics_router, prefix="/api", tags=["metrics"])
-    app.include_router(config_router, prefix="/api", tags=["config"])
-    app.include_router(experiments_router, prefix="/api", tags=["experiments"])
-    app.include_router(export_router, prefix="/api", tags=["export"])
-    app.include_router(projects_router, prefix="/api", tags=["projects"])
-    app.include_router(gpu_router, prefix="/api", tags=["gpu"])
-    app.include_router(system_router, prefix="/api", tags=["system"])
-    app.include_router(storage_router, prefix="/api", tags=["storage"])
-    app.include_router(import_router, prefix="/api", tags=["import"])
-    
-    # Register UI preferences router
-    app.include_router(ui_preferences_router, prefix="/api", tags=["ui-preferences"])
-    
-    # Register unified remote API
-    app.include_router(remote_router, prefix="/api", tags=["remote"])
+    # Register API routers
+    for router, tag in _API_ROUTERS:
+        app.include_router(router, prefix="/api", tags=[tag])
     logger.info("Remote API routes registered (Remote Viewer ready)")
     
     # Store storage root and mode for access by routers
@@ -163,31 +195,83 @@ def create_app(storage: Optional[str] = None) -> FastAPI:
     return app
 
 
+def _spawn(app: FastAPI, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Start a background task tracked in ``app.state.bg_tasks``.
+    
+    The set keeps a strong reference so the task can't be garbage collected
+    mid-run, and lets the lifespan cancel and await it on shutdown.
+    
+    Args:
+        app: FastAPI application instance
+        coro: Coroutine to run
+        
+    Returns:
+        The created task
+    """
+    task = asyncio.create_task(coro)
+    app.state.bg_tasks.add(task)
+    task.add_done_callback(app.state.bg_tasks.discard)
+    return task
+
+
+async def _rate_limited_handler(request: Request, exc: RateLimitedError) -> JSONResponse:
+    """Translate a RateLimitedError into 429 Too Many Requests."""
+    retry_after = str(max(1, math.ceil(exc.retry_after)))
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "detail": str(exc),
+            "retry_after": exc.retry_after
+        },
+        headers={
+            "Retry-After": retry_after,
+            "X-RateLimit-Reset": retry_after
+        }
+    )
+
+
+# Packaged web UI, resolved once per process
+_PACKAGED_UI_DIR: Optional[Path] = (Path(__file__).parent.parent / "webui").resolve()
+if not _PACKAGED_UI_DIR.is_dir():
+    _PACKAGED_UI_DIR = None
+
+
+@lru_cache(maxsize=8)
+def _resolve_frontend_dir(dir_s: str) -> Optional[Path]:
+    """Resolve an env-provided frontend dist directory, or None if missing."""
+    path = Path(dir_s).resolve()
+    return path if path.is_dir() else None
+
+
 def _mount_static_frontend(app: FastAPI) -> None:
     """
     Mount static frontend files if available.
     
+    Directories are resolved once per process and mounted with
+    ``check_dir=False`` since they were already verified.
+    
     Args:
         app: FastAPI application instance
     """
-    import os
-    
     try:
         # Check for development frontend dist path
         env_dir_s = os.environ.get("RUNICORN_FRONTEND_DIST") or os.environ.get("RUNICORN_DESKTOP_FRONTEND")
         if env_dir_s:
-            env_dir = Path(env_dir_s)
-            if env_dir.exists():
-                app.mount("/", StaticFiles(directory=str(env_dir), html=True), name="frontend")
+            env_dir = _resolve_frontend_dir(env_dir_s)
+            if env_dir is not None:
+                static = StaticFiles(directory=str(env_dir), html=True, check_dir=False)
+                app.mount("/", static, name="frontend")
                 return
     except Exception as e:
         logger.debug(f"Could not mount development frontend: {e}")
     
     try:
         # Fallback: serve the packaged webui if present
-        ui_dir = Path(__file__).parent.parent / "webui"
-        if ui_dir.exists():
-            app.mount("/", StaticFiles(directory=str(ui_dir), html=True), name="frontend")
+        ui_dir = _PACKAGED_UI_DIR
+        if ui_dir is not None:
+            static = StaticFiles(directory=str(ui_dir), html=True, check_dir=False)
+            app.mount("/", static, name="frontend")
             logger.info(f"Mounted static frontend from: {ui_dir}")
     except Exception as e:
-        logger.debug(f"Static frontend not available: {e}")
\ No newline at end of file
+        logger.debug(f"Static frontend not available: {e}")
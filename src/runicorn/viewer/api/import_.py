@@ -14,7 +14,7 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Request, UploadFile, File
 
-from ..services.storage import iter_all_runs
+from ..services.storage import iter_all_runs, list_all_runs
 from ..utils.helpers import is_within_directory
 
 logger = logging.getLogger(__name__)
@@ -185,7 +185,7 @@ if HAS_MULTIPART:
                 pass
         
         # Compute imported runs delta
-        after_entries = iter_all_runs(storage_root)
+        after_entries = list_all_runs(storage_root)
         after = {entry.dir for entry in after_entries}
         new_dirs = sorted([str(p) for p in (after - before)])
         
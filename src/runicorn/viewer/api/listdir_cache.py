@@ -6,25 +6,90 @@ to avoid overwhelming remote servers with rapid requests.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import posixpath
 import threading
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Literal, Optional, Set, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LISTDIR_WORKERS = 8
+
+
+def _listdir_workers() -> int:
+    """Size of the listdir thread pool (``RUNICORN_LISTDIR_WORKERS``, default 8)."""
+    try:
+        return max(1, int(os.environ.get("RUNICORN_LISTDIR_WORKERS", DEFAULT_LISTDIR_WORKERS)))
+    except ValueError:
+        return DEFAULT_LISTDIR_WORKERS
+
+
+def _norm(path: str) -> str:
+    """Canonicalize a remote (POSIX) path so equivalent spellings share a key."""
+    return posixpath.normpath(path) if path else "/"
+
+
+class RateLimitedError(Exception):
+    """Raised when a listdir is rejected by the rate limiter."""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Rate limited: please wait {retry_after:.1f} seconds before retrying"
+        )
+        self.retry_after = retry_after
+
 
 @dataclass
 class CachedListdirResult:
     """Cached listdir result with TTL."""
     items: List[Dict[str, Any]]
-    cached_at: float
-    ttl_seconds: float
+    expires_at: float  # time.monotonic() deadline
     
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
-        return time.time() - self.cached_at > self.ttl_seconds
+        return time.monotonic() >= self.expires_at
+
+
+# Cache / rate limit key: (connection_id, normalized path)
+_Key = Tuple[str, str]
+
+_STAT_KEYS = ('total_requests', 'cache_hits', 'cache_misses', 'rate_limited', 'evictions')
+
+
+class _CacheShard:
+    """One lock-striped slice of the listdir cache and rate limit state."""
+    
+    __slots__ = ("lock", "cache", "next_allowed", "keys_by_connection", "stats")
+    
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        
+        # In-memory LRU cache, least recently used first
+        self.cache: OrderedDict[_Key, CachedListdirResult] = OrderedDict()
+        
+        # Earliest monotonic time the next request per connection+path may run
+        self.next_allowed: Dict[_Key, float] = {}
+        
+        # connection_id -> cache keys, for selective invalidation
+        self.keys_by_connection: Dict[str, Set[_Key]] = defaultdict(set)
+        
+        self.stats: Dict[str, int] = dict.fromkeys(_STAT_KEYS, 0)
+    
+    def remove(self, cache_key: _Key) -> None:
+        """Drop a cache entry and its connection index record (lock held)."""
+        del self.cache[cache_key]
+        connection_id = cache_key[0]
+        keys = self.keys_by_connection.get(connection_id)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self.keys_by_connection[connection_id]
 
 
 class ListdirRateLimiter:
@@ -35,16 +100,22 @@ class ListdirRateLimiter:
     - Limits listdir rate to max 0.5 QPS (1 request per 2 seconds)
     - In-memory cache with 5 second TTL
     - Per-connection tracking
+    
+    State is striped across shards by (connection, path), each with its own
+    lock, so concurrent listdirs rarely contend. Keys spread evenly over the
+    shards, so even a single busy connection can use the whole entry budget.
     """
     
     DEFAULT_MIN_INTERVAL_SECONDS = 2.0  # 0.5 QPS
     DEFAULT_CACHE_TTL_SECONDS = 5.0
+    DEFAULT_NUM_SHARDS = 16
     
     def __init__(
         self,
         min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS,
         cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
-        max_cache_entries: int = 1000
+        max_cache_entries: int = 1000,
+        num_shards: int = DEFAULT_NUM_SHARDS
     ):
         """
         Initialize rate limiter with caching.
@@ -52,37 +123,49 @@ class ListdirRateLimiter:
         Args:
             min_interval_seconds: Minimum seconds between requests (default: 2s = 0.5 QPS)
             cache_ttl_seconds: Cache TTL in seconds (default: 5s)
-            max_cache_entries: Maximum cache entries before eviction (default: 1000)
+            max_cache_entries: Maximum cache entries before eviction (default: 1000),
+                split evenly across shards
+            num_shards: Number of independently locked shards (default: 16)
         """
         self.min_interval = min_interval_seconds
         self.cache_ttl = cache_ttl_seconds
         self.max_cache_entries = max_cache_entries
         
-        # Track last request time per connection+path
-        self._last_request: Dict[str, float] = {}
-        
-        # In-memory cache
-        self._cache: Dict[str, CachedListdirResult] = {}
+        num_shards = max(1, num_shards)
+        self._shards = tuple(_CacheShard() for _ in range(num_shards))
+        self._max_entries_per_shard = max(1, -(-max_cache_entries // num_shards))
         
-        # Thread safety
-        self._lock = threading.Lock()
+        # connection+path -> pending listdir, shared by concurrent callers
+        # (only touched from the event loop, so no lock is needed)
+        self._inflight: Dict[_Key, asyncio.Future] = {}
         
-        # Statistics
-        self.stats = {
-            'total_requests': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'rate_limited': 0,
-            'evictions': 0,
-        }
+        # Blocking SSH listdirs get their own bounded pool so a browsing
+        # burst can't starve the event loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=_listdir_workers(),
+            thread_name_prefix="ssh-listdir"
+        )
         
         logger.info(
             f"ListdirRateLimiter initialized: "
             f"min_interval={min_interval_seconds}s, "
             f"cache_ttl={cache_ttl_seconds}s, "
-            f"max_entries={max_cache_entries}"
+            f"max_entries={max_cache_entries}, "
+            f"shards={num_shards}"
         )
     
+    def _shard(self, key: _Key) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters summed over all shards."""
+        totals = dict.fromkeys(_STAT_KEYS, 0)
+        for shard in self._shards:
+            for key, value in shard.stats.items():
+                totals[key] += value
+        return totals
+    
     def check_rate_limit(
         self,
         connection_id: str,
@@ -100,25 +183,25 @@ class ListdirRateLimiter:
             - allowed: True if request can proceed
             - wait_seconds: Seconds to wait if rate limited
         """
-        with self._lock:
-            key = f"{connection_id}:{path}"
-            now = time.time()
+        path = _norm(path)
+        shard = self._shard((connection_id, path))
+        with shard.lock:
+            key = (connection_id, path)
+            now = time.monotonic()
             
-            last_time = self._last_request.get(key, 0)
-            elapsed = now - last_time
-            
-            if elapsed < self.min_interval:
+            next_allowed = shard.next_allowed.get(key)
+            if next_allowed is not None and now < next_allowed:
                 # Rate limited
-                wait_seconds = self.min_interval - elapsed
-                self.stats['rate_limited'] += 1
+                wait_seconds = next_allowed - now
+                shard.stats['rate_limited'] += 1
                 logger.debug(
                     f"Rate limited: {connection_id} path={path}, "
                     f"wait={wait_seconds:.2f}s"
                 )
                 return False, wait_seconds
             
-            # Update last request time
-            self._last_request[key] = now
+            # Start a new interval
+            shard.next_allowed[key] = now + self.min_interval
             return True, None
     
     def get_cached(
@@ -136,23 +219,73 @@ class ListdirRateLimiter:
         Returns:
             Cached items list or None if not cached/expired
         """
-        with self._lock:
-            self.stats['total_requests'] += 1
+        path = _norm(path)
+        shard = self._shard((connection_id, path))
+        with shard.lock:
+            shard.stats['total_requests'] += 1
             
-            cache_key = f"{connection_id}:{path}"
-            cached = self._cache.get(cache_key)
+            cache_key = (connection_id, path)
+            cached = shard.cache.get(cache_key)
             
             if cached and not cached.is_expired():
-                self.stats['cache_hits'] += 1
+                shard.cache.move_to_end(cache_key)
+                shard.stats['cache_hits'] += 1
                 logger.debug(
                     f"Cache hit: {connection_id} path={path}, "
-                    f"age={time.time() - cached.cached_at:.1f}s"
+                    f"ttl_left={cached.expires_at - time.monotonic():.1f}s"
                 )
                 return cached.items
             
-            self.stats['cache_misses'] += 1
+            shard.stats['cache_misses'] += 1
             return None
     
+    def peek_or_reserve(
+        self,
+        connection_id: str,
+        path: str
+    ) -> Tuple[Literal['hit', 'allow', 'deny'], Any]:
+        """
+        Serve from cache or take a rate limit slot, under a single lock.
+        
+        Equivalent to ``get_cached`` followed by ``check_rate_limit`` on a
+        miss, without acquiring the shard lock twice.
+        
+        Args:
+            connection_id: SSH connection identifier
+            path: Remote path being listed
+            
+        Returns:
+            (outcome, value) tuple
+            - ('hit', items): fresh cached items
+            - ('allow', None): cache miss, request may proceed
+            - ('deny', wait_seconds): cache miss and rate limited
+        """
+        path = _norm(path)
+        key = (connection_id, path)
+        shard = self._shard((connection_id, path))
+        with shard.lock:
+            shard.stats['total_requests'] += 1
+            now = time.monotonic()
+            
+            cached = shard.cache.get(key)
+            if cached and now < cached.expires_at:
+                shard.cache.move_to_end(key)
+                shard.stats['cache_hits'] += 1
+                return 'hit', cached.items
+            shard.stats['cache_misses'] += 1
+            
+            next_allowed = shard.next_allowed.get(key)
+            if next_allowed is not None and now < next_allowed:
+                shard.stats['rate_limited'] += 1
+                logger.debug(
+                    f"Rate limited: {connection_id} path={path}, "
+                    f"wait={next_allowed - now:.2f}s"
+                )
+                return 'deny', next_allowed - now
+            
+            shard.next_allowed[key] = now + self.min_interval
+            return 'allow', None
+    
     def put_cache(
         self,
         connection_id: str,
@@ -167,42 +300,30 @@ class ListdirRateLimiter:
             path: Remote path being listed
             items: List of directory items
         """
-        with self._lock:
-            cache_key = f"{connection_id}:{path}"
+        path = _norm(path)
+        shard = self._shard((connection_id, path))
+        with shard.lock:
+            cache_key = (connection_id, path)
             
-            # Evict oldest entries if cache is full
-            if len(self._cache) >= self.max_cache_entries:
-                self._evict_oldest()
+            # Evict least recently used entries if the shard is full
+            if cache_key in shard.cache:
+                shard.remove(cache_key)
+            while len(shard.cache) >= self._max_entries_per_shard:
+                shard.remove(next(iter(shard.cache)))
+                shard.stats['evictions'] += 1
             
             # Store in cache
-            self._cache[cache_key] = CachedListdirResult(
+            shard.cache[cache_key] = CachedListdirResult(
                 items=items,
-                cached_at=time.time(),
-                ttl_seconds=self.cache_ttl
+                expires_at=time.monotonic() + self.cache_ttl
             )
+            shard.keys_by_connection[connection_id].add(cache_key)
             
             logger.debug(
                 f"Cached: {connection_id} path={path}, "
-                f"items={len(items)}, cache_size={len(self._cache)}"
+                f"items={len(items)}, shard_size={len(shard.cache)}"
             )
     
-    def _evict_oldest(self) -> None:
-        """Evict oldest cache entries to make room."""
-        if not self._cache:
-            return
-        
-        # Find and remove oldest 10% of entries
-        entries = list(self._cache.items())
-        entries.sort(key=lambda x: x[1].cached_at)
-        
-        evict_count = max(1, len(entries) // 10)
-        for i in range(evict_count):
-            key, _ = entries[i]
-            del self._cache[key]
-            self.stats['evictions'] += 1
-        
-        logger.debug(f"Evicted {evict_count} cache entries")
-    
     def invalidate(
         self,
         connection_id: Optional[str] = None,
@@ -218,37 +339,42 @@ class ListdirRateLimiter:
         Returns:
             Number of entries invalidated
         """
-        with self._lock:
-            if connection_id is None and path is None:
-                # Invalidate all
-                count = len(self._cache)
-                self._cache.clear()
-                self._last_request.clear()
-                logger.info(f"Invalidated entire cache ({count} entries)")
-                return count
-            
-            # Selective invalidation
-            keys_to_remove = []
-            for key in self._cache.keys():
-                conn_id, cache_path = key.split(':', 1)
-                
-                if connection_id and conn_id != connection_id:
-                    continue
-                if path and cache_path != path:
-                    continue
+        if path:
+            path = _norm(path)
+        if connection_id is None and path is None:
+            # Invalidate all
+            count = 0
+            for shard in self._shards:
+                with shard.lock:
+                    count += len(shard.cache)
+                    shard.cache.clear()
+                    shard.keys_by_connection.clear()
+                    shard.next_allowed.clear()
+            logger.info(f"Invalidated entire cache ({count} entries)")
+            return count
+        
+        # Selective invalidation
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                if connection_id:
+                    # Only this connection's entries need checking
+                    candidates = list(shard.keys_by_connection.get(connection_id, ()))
+                else:
+                    candidates = list(shard.cache.keys())
                 
-                keys_to_remove.append(key)
-            
-            for key in keys_to_remove:
-                del self._cache[key]
-                if key in self._last_request:
-                    del self._last_request[key]
-            
-            logger.info(
-                f"Invalidated {len(keys_to_remove)} cache entries "
-                f"(connection={connection_id}, path={path})"
-            )
-            return len(keys_to_remove)
+                for key in candidates:
+                    if path and key[1] != path:
+                        continue
+                    shard.remove(key)
+                    shard.next_allowed.pop(key, None)
+                    removed += 1
+        
+        logger.info(
+            f"Invalidated {removed} cache entries "
+            f"(connection={connection_id}, path={path})"
+        )
+        return removed
     
     def cleanup_expired(self) -> int:
         """
@@ -257,34 +383,46 @@ class ListdirRateLimiter:
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            expired_keys = [
-                key for key, cached in self._cache.items()
-                if cached.is_expired()
-            ]
+        removed = 0
+        for shard in self._shards:
+            # Snapshot under the lock, check expiry outside it, then re-take
+            # the lock only to drop entries that weren't replaced meanwhile
+            with shard.lock:
+                snapshot = list(shard.cache.items())
             
-            for key in expired_keys:
-                del self._cache[key]
+            expired = [(key, cached) for key, cached in snapshot if cached.is_expired()]
+            if not expired:
+                continue
             
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-            
-            return len(expired_keys)
+            with shard.lock:
+                for key, cached in expired:
+                    if shard.cache.get(key) is cached:
+                        shard.remove(key)
+                        removed += 1
+        
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired cache entries")
+        
+        return removed
+    
+    def close(self) -> None:
+        """Shut down the listdir thread pool, dropping queued listdirs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiter statistics."""
-        with self._lock:
-            hit_rate = (
-                self.stats['cache_hits'] / self.stats['total_requests']
-                if self.stats['total_requests'] > 0 else 0
-            )
-            
-            return {
-                **self.stats,
-                'cache_size': len(self._cache),
-                'cache_hit_rate': hit_rate,
-                'tracked_paths': len(self._last_request),
-            }
+        stats = self.stats
+        hit_rate = (
+            stats['cache_hits'] / stats['total_requests']
+            if stats['total_requests'] > 0 else 0
+        )
+        
+        return {
+            **stats,
+            'cache_size': sum(len(shard.cache) for shard in self._shards),
+            'cache_hit_rate': hit_rate,
+            'tracked_paths': sum(len(shard.next_allowed) for shard in self._shards),
+        }
 
 
 # Global instance
@@ -302,6 +440,41 @@ def get_global_rate_limiter() -> ListdirRateLimiter:
         return _global_rate_limiter
 
 
+def close_global_rate_limiter() -> None:
+    """Close the global rate limiter, if one was created."""
+    global _global_rate_limiter
+    
+    with _global_lock:
+        if _global_rate_limiter is not None:
+            _global_rate_limiter.close()
+            _global_rate_limiter = None
+
+
+async def periodic_cache_cleanup(interval_seconds: float = 30.0) -> None:
+    """
+    Periodically drop expired listdir cache entries.
+    
+    Runs as a background task so eviction happens off the request path
+    instead of only when the cache fills up.
+    
+    Args:
+        interval_seconds: Seconds between cleanup passes
+    """
+    while True:
+        try:
+            await asyncio.sleep(interval_seconds)
+            # Nothing to clean until the first remote listdir creates the limiter
+            limiter = _global_rate_limiter
+            if limiter is not None:
+                limiter.cleanup_expired()
+        except asyncio.CancelledError:
+            logger.info("Listdir cache cleanup task cancelled")
+            break
+        except Exception as e:
+            # Log but don't crash - keep cleaning
+            logger.error(f"Listdir cache cleanup error: {e}", exc_info=True)
+
+
 async def rate_limited_listdir(
     connection_id: str,
     path: str,
@@ -312,6 +485,9 @@ async def rate_limited_listdir(
     """
     Perform rate-limited and cached listdir operation.
     
+    Concurrent calls for the same connection and path share a single
+    listdir instead of each hitting the remote host.
+    
     Args:
         connection_id: SSH connection identifier
         path: Remote path to list
@@ -323,34 +499,48 @@ async def rate_limited_listdir(
         List of directory items
         
     Raises:
-        Exception: If rate limited or listdir fails
+        RateLimitedError: If rate limited
+        Exception: If listdir fails
     """
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-    
     if rate_limiter is None:
         rate_limiter = get_global_rate_limiter()
+    path = _norm(path)
     
-    # Check cache first
-    if use_cache:
-        cached_result = rate_limiter.get_cached(connection_id, path)
-        if cached_result is not None:
-            return cached_result
+    # Join an identical listdir that is already running
+    key = (connection_id, path)
+    inflight = rate_limiter._inflight.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
     
-    # Check rate limit
-    allowed, wait_seconds = rate_limiter.check_rate_limit(connection_id, path)
+    # Check cache and rate limit in one go
+    if use_cache:
+        outcome, value = rate_limiter.peek_or_reserve(connection_id, path)
+        if outcome == 'hit':
+            return value
+        allowed, wait_seconds = outcome == 'allow', value
+    else:
+        allowed, wait_seconds = rate_limiter.check_rate_limit(connection_id, path)
     if not allowed:
-        raise Exception(
-            f"Rate limited: please wait {wait_seconds:.1f} seconds before retrying"
-        )
+        raise RateLimitedError(wait_seconds)
     
-    # Perform actual listdir in thread pool to avoid blocking event loop
+    # Perform actual listdir in the dedicated pool to avoid blocking event loop
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    rate_limiter._inflight[key] = future
     try:
-        loop = asyncio.get_event_loop()
-        items = await loop.run_in_executor(None, listdir_func)
+        items = await loop.run_in_executor(rate_limiter._executor, listdir_func)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
     except Exception as e:
         logger.error(f"Listdir failed for {connection_id}:{path}: {e}")
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; waiters (if any) re-raise it
         raise
+    else:
+        future.set_result(items)
+    finally:
+        rate_limiter._inflight.pop(key, None)
     
     # Cache result
     if use_cache:
@@ -186,7 +186,7 @@ async def get_metrics(
     events_path = entry.dir / "events.jsonl"
     
     # Execute blocking I/O in thread pool to prevent event loop blocking
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     cols, rows = await loop.run_in_executor(
         _metrics_executor,
         _get_metrics_sync,
@@ -254,7 +254,7 @@ async def get_metrics_step(
     events_path = entry.dir / "events.jsonl"
     
     # Execute blocking I/O in thread pool to prevent event loop blocking
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     cols, rows = await loop.run_in_executor(
         _metrics_executor,
         _get_metrics_sync,
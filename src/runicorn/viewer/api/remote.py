@@ -54,6 +54,13 @@ class SSHConnectRequest(BaseModel):
     private_key_path: Optional[str] = Field(None, description="Path to private key file")
     passphrase: Optional[str] = Field(None, description="Passphrase for private key")
     use_agent: bool = Field(True, description="Use SSH agent")
+    compression: bool = Field(
+        True,
+        description=(
+            "Enable SSH transport compression "
+            "(helps JSON/log traffic; disable for mostly binary payloads)"
+        ),
+    )
 
 
 class RemoteViewerStartRequest(BaseModel):
@@ -66,6 +73,13 @@ class RemoteViewerStartRequest(BaseModel):
     private_key_path: Optional[str] = Field(None, description="Path to private key file")
     passphrase: Optional[str] = Field(None, description="Passphrase for private key")
     use_agent: bool = Field(True, description="Use SSH agent")
+    compression: bool = Field(
+        True,
+        description=(
+            "Enable SSH transport compression "
+            "(helps JSON/log traffic; disable for mostly binary payloads)"
+        ),
+    )
     remote_root: str = Field(..., description="Remote storage root directory")
     local_port: Optional[int] = Field(None, description="Local port (auto-detect if None)")
     remote_port: Optional[int] = Field(None, description="Remote port (auto-detect if None)")
@@ -137,6 +151,7 @@ async def connect_remote(request: Request, payload: SSHConnectRequest) -> Dict[s
             private_key_path=payload.private_key_path,
             passphrase=payload.passphrase,
             use_agent=payload.use_agent,
+            compression=payload.compression,
         )
         
         # Get or create connection
@@ -406,6 +421,7 @@ async def start_remote_viewer(
             private_key_path=payload.private_key_path,
             passphrase=payload.passphrase,
             use_agent=payload.use_agent,
+            compression=payload.compression,
         )
         
         connection = pool.get_or_create(config)
@@ -6,67 +6,86 @@ Applies rate limiting to API endpoints.
 from __future__ import annotations
 
 import logging
-from typing import Callable
+from typing import Tuple
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ...security.rate_limiter import get_rate_limiter
+from ...security.rate_limiter import EndpointRateLimiter, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+def _header_names(limiter: EndpointRateLimiter) -> Tuple[str, str, str]:
+    """Get the (limit, remaining, reset) header names from settings."""
+    custom_headers = limiter.get_settings().get("custom_headers", {})
+    return (
+        custom_headers.get("rate_limit_header", "X-RateLimit-Limit"),
+        custom_headers.get("rate_limit_remaining_header", "X-RateLimit-Remaining"),
+        custom_headers.get("rate_limit_reset_header", "X-RateLimit-Reset"),
+    )
+
+
+class RateLimitMiddleware:
     """
     Middleware to apply rate limiting to requests.
+
+    Written as plain ASGI rather than ``BaseHTTPMiddleware``: the limiter
+    check runs inline and responses (including streaming ones) are passed
+    straight through, with the rate limit headers added to the start message.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and apply rate limiting.
-        
+
         Args:
-            request: The incoming request
-            call_next: The next middleware or endpoint handler
-            
-        Returns:
-            Response from the endpoint or rate limit error
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip rate limiting for non-API routes
-        if not request.url.path.startswith("/api/"):
-            return await call_next(request)
-        
+        # Skip rate limiting for non-HTTP traffic and non-API routes
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
         # Skip rate limiting for OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        # Get rate limiter
+        limiter = get_rate_limiter()
+
+        # Fast path: with limiting disabled (the default for the local viewer)
+        # polling endpoints skip the limiter and header bookkeeping entirely
+        if not limiter.is_enabled():
+            await self.app(scope, receive, send)
+            return
+
         # Get client identifier (IP address)
-        client_ip = request.client.host if request.client else "unknown"
-        
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
         # Check for X-Forwarded-For header if behind proxy
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = Headers(scope=scope).get("x-forwarded-for")
         if forwarded_for:
             # Take the first IP in the chain
             client_ip = forwarded_for.split(",")[0].strip()
-        
-        # Get rate limiter
-        limiter = get_rate_limiter()
-        
+
         # Check if request is allowed
-        endpoint = request.url.path
+        endpoint = scope["path"]
         is_allowed, retry_after = limiter.is_allowed(endpoint, client_ip)
-        
+        limit_header, remaining_header, reset_header = _header_names(limiter)
+
         if not is_allowed:
-            # Get custom header names from settings
-            settings = limiter.get_settings()
-            custom_headers = settings.get("custom_headers", {})
-            limit_header = custom_headers.get("rate_limit_header", "X-RateLimit-Limit")
-            remaining_header = custom_headers.get("rate_limit_remaining_header", "X-RateLimit-Remaining")
-            reset_header = custom_headers.get("rate_limit_reset_header", "X-RateLimit-Reset")
-            
             # Return 429 Too Many Requests
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": "Rate limit exceeded",
@@ -79,21 +98,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     reset_header: str(retry_after)
                 }
             )
-        
+            await response(scope, receive, send)
+            return
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to response
+                usage = limiter.get_limiter(endpoint).get_usage(client_ip)
+                headers = MutableHeaders(scope=message)
+                headers[limit_header] = str(usage["limit"])
+                headers[remaining_header] = str(usage["remaining"])
+                headers[reset_header] = str(usage["reset_in"])
+            await send(message)
+
         # Process the request
-        response = await call_next(request)
-        
-        # Get custom header names from settings
-        settings = limiter.get_settings()
-        custom_headers = settings.get("custom_headers", {})
-        limit_header = custom_headers.get("rate_limit_header", "X-RateLimit-Limit")
-        remaining_header = custom_headers.get("rate_limit_remaining_header", "X-RateLimit-Remaining")
-        reset_header = custom_headers.get("rate_limit_reset_header", "X-RateLimit-Reset")
-        
-        # Add rate limit headers to response
-        usage = limiter.get_limiter(endpoint).get_usage(client_ip)
-        response.headers[limit_header] = str(usage["limit"])
-        response.headers[remaining_header] = str(usage["remaining"])
-        response.headers[reset_header] = str(usage["reset_in"])
-        
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -23,6 +23,7 @@ from ...storage.file_utils import (
     restore_run,
     list_run_dirs_legacy,
     iter_all_runs,
+    list_all_runs,
     find_run_dir_by_id,
     periodic_status_check
 )
@@ -44,6 +45,7 @@ __all__ = [
     "restore_run",
     "list_run_dirs_legacy",
     "iter_all_runs",
+    "list_all_runs",
     "find_run_dir_by_id",
     "periodic_status_check"
 ]
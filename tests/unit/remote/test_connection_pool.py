@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+from runicorn.remote import connection
+from runicorn.remote.connection import SSHConfig, SSHConnectionPool
+
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeConnection:
+    def __init__(self, config: SSHConfig) -> None:
+        self.config = config
+        self.is_connected = False
+
+    def connect(self) -> None:
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+
+def test_pool_reconnects_when_compression_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(connection, "SSHConnection", _FakeConnection)
+    pool = SSHConnectionPool()
+
+    first = pool.get_or_create(SSHConfig(host="h", username="u", compression=True))
+    assert pool.get_or_create(SSHConfig(host="h", username="u", compression=True)) is first
+
+    second = pool.get_or_create(SSHConfig(host="h", username="u", compression=False))
+    assert second is not first
+    assert second.config.compression is False
+    assert not first.is_connected
+    assert pool.get_connection("h", 22, "u") is second
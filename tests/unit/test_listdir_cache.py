@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from runicorn.viewer.api.listdir_cache import ListdirRateLimiter
+
+
+def _items(name: str) -> list:
+    return [{"name": name}]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    limiter = ListdirRateLimiter(max_cache_entries=2, num_shards=1)
+    limiter.put_cache("c", "/a", _items("a"))
+    limiter.put_cache("c", "/b", _items("b"))
+
+    # Touch /a so /b becomes the eviction candidate
+    assert limiter.get_cached("c", "/a") == _items("a")
+    limiter.put_cache("c", "/c", _items("c"))
+
+    assert limiter.get_cached("c", "/b") is None
+    assert limiter.get_cached("c", "/a") == _items("a")
+    assert limiter.get_cached("c", "/c") == _items("c")
+    assert limiter.get_stats()["evictions"] == 1
+
+
+def test_invalidate_by_connection_and_path() -> None:
+    limiter = ListdirRateLimiter()
+    limiter.put_cache("user@host:22", "/data", _items("x"))
+    limiter.put_cache("user@host:22", "/tmp", _items("y"))
+    limiter.put_cache("other:22", "/data", _items("z"))
+
+    assert limiter.invalidate(connection_id="user@host:22", path="/data") == 1
+    assert limiter.get_cached("user@host:22", "/tmp") == _items("y")
+
+    assert limiter.invalidate(path="/data") == 1
+    assert limiter.get_cached("other:22", "/data") is None
+
+    assert limiter.invalidate(connection_id="user@host:22") == 1
+    assert limiter.get_stats()["cache_size"] == 0
+
+
+def test_single_connection_uses_whole_entry_budget() -> None:
+    limiter = ListdirRateLimiter(max_cache_entries=1000, num_shards=16)
+    paths = [f"/data/{i}" for i in range(200)]  # well over 1000 / 16 per shard
+    for path in paths:
+        limiter.put_cache("user@host:22", path, _items(path))
+        assert limiter.check_rate_limit("user@host:22", path) == (True, None)
+
+    assert all(limiter.get_cached("user@host:22", p) == _items(p) for p in paths)
+    stats = limiter.get_stats()
+    assert stats["cache_size"] == 200
+    assert stats["evictions"] == 0
+    assert stats["tracked_paths"] == 200
+
+    assert limiter.invalidate(connection_id="user@host:22") == 200
+
+
+def test_expiry_and_rate_limit_use_monotonic_deadlines(monkeypatch) -> None:
+    from runicorn.viewer.api import listdir_cache
+
+    clock = [1000.0]
+    monkeypatch.setattr(listdir_cache.time, "monotonic", lambda: clock[0])
+    limiter = ListdirRateLimiter(min_interval_seconds=2.0, cache_ttl_seconds=5.0)
+
+    limiter.put_cache("c", "/", _items("a"))
+    assert limiter.check_rate_limit("c", "/") == (True, None)
+    clock[0] += 1.5
+    assert limiter.check_rate_limit("c", "/") == (False, 0.5)
+    clock[0] += 0.5
+    assert limiter.check_rate_limit("c", "/") == (True, None)
+
+    assert limiter.get_cached("c", "/") == _items("a")
+    clock[0] += 3.0
+    assert limiter.get_cached("c", "/") is None
+
+
+def test_concurrent_listdir_calls_are_coalesced() -> None:
+    import asyncio
+    import threading
+
+    from runicorn.viewer.api.listdir_cache import rate_limited_listdir
+
+    limiter = ListdirRateLimiter()
+    release = threading.Event()
+    calls = []
+
+    def listdir():
+        calls.append(1)
+        release.wait(5)
+        return _items("a")
+
+    async def main():
+        tasks = [
+            asyncio.create_task(rate_limited_listdir("c", "/", listdir, rate_limiter=limiter))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == [_items("a")] * 3
+    assert len(calls) == 1
+    assert limiter.get_stats()["rate_limited"] == 0
+    assert limiter._inflight == {}
+
+
+def test_listdir_runs_on_dedicated_pool(monkeypatch) -> None:
+    import asyncio
+    import threading
+
+    from runicorn.viewer.api.listdir_cache import rate_limited_listdir
+
+    monkeypatch.setenv("RUNICORN_LISTDIR_WORKERS", "2")
+    limiter = ListdirRateLimiter()
+    try:
+        assert limiter._executor._max_workers == 2
+        def listdir():
+            return threading.current_thread().name
+
+        thread_name = asyncio.run(rate_limited_listdir("c", "/", listdir, rate_limiter=limiter))
+        assert thread_name.startswith("ssh-listdir")
+    finally:
+        limiter.close()
+
+
+def test_equivalent_paths_share_cache_entry() -> None:
+    limiter = ListdirRateLimiter()
+    limiter.put_cache("c", "/a/", _items("a"))
+
+    assert limiter.get_cached("c", "/a") == _items("a")
+    assert limiter.get_cached("c", "/a/./") == _items("a")
+    assert limiter.get_stats()["cache_size"] == 1
+
+    assert limiter.invalidate(path="/a/") == 1
+
+
+def test_cleanup_expired_keeps_fresh_entries(monkeypatch) -> None:
+    from runicorn.viewer.api import listdir_cache
+
+    clock = [1000.0]
+    monkeypatch.setattr(listdir_cache.time, "monotonic", lambda: clock[0])
+    limiter = ListdirRateLimiter(cache_ttl_seconds=5.0)
+
+    limiter.put_cache("c", "/old", _items("old"))
+    clock[0] += 4.0
+    limiter.put_cache("c", "/new", _items("new"))
+    clock[0] += 2.0
+
+    assert limiter.cleanup_expired() == 1
+    assert limiter.get_cached("c", "/old") is None
+    assert limiter.get_cached("c", "/new") == _items("new")
+
+
+def test_peek_or_reserve_outcomes() -> None:
+    limiter = ListdirRateLimiter(min_interval_seconds=60.0)
+
+    assert limiter.peek_or_reserve("c", "/a") == ("allow", None)
+    outcome, wait = limiter.peek_or_reserve("c", "/a")
+    assert outcome == "deny" and 0 < wait <= 60.0
+
+    limiter.put_cache("c", "/a/", _items("a"))
+    assert limiter.peek_or_reserve("c", "/a") == ("hit", _items("a"))
+
+    stats = limiter.get_stats()
+    assert (stats["cache_hits"], stats["cache_misses"], stats["rate_limited"]) == (1, 2, 1)
+
+
+def test_rate_limited_error_maps_to_429(tmp_path) -> None:
+    from fastapi.testclient import TestClient
+
+    from runicorn.viewer import create_app
+    from runicorn.viewer.api.listdir_cache import RateLimitedError
+
+    app = create_app(str(tmp_path))
+
+    @app.get("/api/test-listdir")
+    def listdir() -> dict:
+        raise RateLimitedError(1.2)
+
+    resp = TestClient(app).get("/api/test-listdir")
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    assert resp.headers["X-RateLimit-Reset"] == "2"
+    assert resp.json()["retry_after"] == 1.2
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import runicorn as rn
+from runicorn.extensions.monitors import MetricMonitor
+
+
+def test_run_log_passes_full_payload_to_monitor(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("RUNICORN_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("RUNICORN_DISABLE_MODERN_STORAGE", "1")
+
+    class PlainMonitor:
+        """A monitor without MetricMonitor's extras."""
+
+        def __init__(self) -> None:
+            self.seen = []
+
+        def check_metrics(self, metrics):
+            self.seen.append(dict(metrics))
+            return []
+
+    plain, metric_monitor = PlainMonitor(), MetricMonitor()
+    with rn.enabled(True):
+        run = rn.init(path="p", snapshot_code=False, workspace_root=str(tmp_path))
+        try:
+            for monitor in (plain, metric_monitor):
+                run.monitor = monitor
+                run._select_log_impl()
+                run.log({"acc": 0.5, "loss": 1.0}, step=1)
+        finally:
+            run.finish()
+
+    assert plain.seen and plain.seen[0].keys() >= {"acc", "loss"}
+    assert metric_monitor.metrics_history.keys() >= {"acc", "loss"}
@@ -315,3 +315,53 @@ def test_outputs_scan_directory_entry(monkeypatch: pytest.MonkeyPatch, tmp_path:
         assert assets["outputs"][0]["kind"] == "dir"
 
         run.finish()
+
+
+def test_outputs_scan_paths_only_touches_dirty_entries(tmp_path: Path) -> None:
+    from filelock import FileLock
+
+    from runicorn.assets.assets_json import ensure_assets_file
+    from runicorn.assets.outputs_scan import scan_outputs_once
+
+    storage_root = tmp_path / "storage"
+    run_dir = tmp_path / "run"
+    out_dir = tmp_path / "outputs"
+    for d in (storage_root, run_dir, out_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    (out_dir / "a.pth").write_bytes(b"a")
+    (out_dir / "sub").mkdir()
+    (out_dir / "sub" / "b.pth").write_bytes(b"b")
+
+    assets_path = run_dir / "assets.json"
+    state_path = run_dir / ".outputs_state.json"
+    ensure_assets_file(assets_path)
+
+    def _scan(**kw):
+        return scan_outputs_once(
+            run_id="r1",
+            run_dir=run_dir,
+            storage_root=storage_root,
+            workspace_root=tmp_path,
+            output_dirs=[out_dir],
+            assets_path=assets_path,
+            assets_lock=FileLock(str(assets_path) + ".lock"),
+            state_path=state_path,
+            state_lock=FileLock(str(state_path) + ".lock"),
+            patterns=["**/*.pth"],
+            stable_required=2,
+            min_age_sec=0.0,
+            **kw,
+        )
+
+    r1 = _scan(paths=[out_dir / "sub" / "b.pth"])
+    assert r1["scanned"] == 1
+    assert r1["pending"] == [str((out_dir / "sub" / "b.pth").resolve())]
+
+    r2 = _scan(paths=r1["pending"])
+    assert r2["archived"] == 1
+    assert r2["pending"] == []
+
+    r3 = _scan()
+    assert r3["scanned"] == 2
+    assert r3["archived"] == 0
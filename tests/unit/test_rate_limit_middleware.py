@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from runicorn.security.rate_limiter import EndpointRateLimiter
+from runicorn.viewer.middleware import rate_limit
+
+
+def _make_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    limiter = EndpointRateLimiter()
+    limiter.configure_endpoint("/api/limited", 2, 60)
+    monkeypatch.setattr(rate_limit, "get_rate_limiter", lambda: limiter)
+
+    app = FastAPI()
+    app.add_middleware(rate_limit.RateLimitMiddleware)
+
+    @app.get("/api/limited")
+    def limited() -> dict:
+        return {"ok": True}
+
+    @app.get("/api/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    return app
+
+
+def test_rate_limit_headers_and_429(monkeypatch: pytest.MonkeyPatch) -> None:
+    with TestClient(_make_app(monkeypatch)) as client:
+        r1 = client.get("/api/limited")
+        assert r1.status_code == 200
+        assert r1.headers["X-RateLimit-Limit"] == "2"
+        assert r1.headers["X-RateLimit-Remaining"] == "1"
+
+        assert client.get("/api/limited").status_code == 200
+
+        r3 = client.get("/api/limited")
+        assert r3.status_code == 429
+        assert r3.json()["detail"] == "Rate limit exceeded"
+        assert int(r3.headers["Retry-After"]) > 0
+        assert r3.headers["X-RateLimit-Remaining"] == "0"
+
+        # Preflight requests are never limited
+        assert client.options("/api/limited").status_code != 429
+
+
+def test_streaming_response_passes_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    with TestClient(_make_app(monkeypatch)) as client:
+        r = client.get("/api/stream")
+        assert r.status_code == 200
+        assert r.text == "abc"
+        assert "X-RateLimit-Limit" in r.headers
+
+
+def test_disabled_limiter_passes_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _make_app(monkeypatch)
+    rate_limit.get_rate_limiter().update_settings({"enable_rate_limiting": False})
+
+    with TestClient(app) as client:
+        for _ in range(5):
+            r = client.get("/api/limited")
+            assert r.status_code == 200
+            assert "X-RateLimit-Limit" not in r.headers
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runicorn.storage.file_utils import iter_all_runs
+
+
+def _make_run(run_dir: Path, *, deleted: bool = False) -> Path:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "meta.json").write_text(json.dumps({"id": run_dir.name}), encoding="utf-8")
+    if deleted:
+        (run_dir / ".deleted").write_text("{}", encoding="utf-8")
+    return run_dir
+
+
+def test_iter_all_runs_walks_both_layouts_in_order(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _make_run(runs / "top_run")
+    _make_run(runs / "B" / "x" / "r2")
+    _make_run(runs / "a" / "r1")
+    _make_run(runs / "a" / "deep" / "nested" / "r3")
+    _make_run(runs / "a" / "gone", deleted=True)
+    _make_run(tmp_path / "proj" / "exp" / "runs" / "legacy1")
+
+    found = [(e.path, e.dir.name) for e in iter_all_runs(tmp_path)]
+    assert found == [
+        ("a/deep/nested", "r3"),
+        ("a", "r1"),
+        ("B/x", "r2"),
+        (None, "top_run"),
+        ("proj/exp", "legacy1"),
+    ]
+
+    with_deleted = {e.dir.name for e in iter_all_runs(tmp_path, include_deleted=True)}
+    assert "gone" in with_deleted
+
+
+def test_find_run_dir_by_id_revalidates_cached_location(tmp_path: Path) -> None:
+    from runicorn.storage.file_utils import find_run_dir_by_id, soft_delete_run
+
+    run = _make_run(tmp_path / "runs" / "p" / "abc")
+    assert find_run_dir_by_id(tmp_path, "abc").dir == run
+    assert find_run_dir_by_id(tmp_path, "missing") is None
+
+    moved = tmp_path / "runs" / "q" / "abc"
+    moved.parent.mkdir(parents=True)
+    run.rename(moved)
+    assert find_run_dir_by_id(tmp_path, "abc").dir == moved
+
+    soft_delete_run(moved)
+    assert find_run_dir_by_id(tmp_path, "abc") is None
+    assert find_run_dir_by_id(tmp_path, "abc", include_deleted=True).dir == moved
+
+
+def test_find_run_dir_by_id_uses_index_db(monkeypatch, tmp_path: Path) -> None:
+    import runicorn as rn
+    from runicorn.storage import file_utils
+
+    monkeypatch.setenv("RUNICORN_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("RUNICORN_DISABLE_MODERN_STORAGE", "1")
+    with rn.enabled(True):
+        run = rn.init(path="cv/det", snapshot_code=False, workspace_root=str(tmp_path))
+        run.finish()
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("tree walk not expected")
+
+    monkeypatch.setattr(file_utils, "iter_all_runs", _no_walk)
+    entry = file_utils.find_run_dir_by_id(tmp_path / "storage", run.id)
+    assert entry is not None
+    assert entry.path == "cv/det"
+    assert entry.dir == tmp_path / "storage" / "runs" / "cv" / "det" / run.id
+
+
+def test_iter_all_runs_stops_scanning_when_closed(monkeypatch, tmp_path: Path) -> None:
+    from runicorn.storage import file_utils
+
+    for i in range(20):
+        _make_run(tmp_path / "runs" / f"p{i:02d}" / "r")
+
+    started = []
+    walk = file_utils._walk_run_candidates
+
+    def counting_walk(candidates, include_deleted):
+        started.append(candidates[0][1])
+        return walk(candidates, include_deleted)
+
+    monkeypatch.setattr(file_utils, "_walk_run_candidates", counting_walk)
+    monkeypatch.setattr(file_utils, "_SCAN_WORKERS", 2)
+
+    runs = file_utils.iter_all_runs(tmp_path)
+    assert next(runs).path == "p00"
+    runs.close()
+    # Window of 2 plus the refill after the first result
+    assert len(started) <= 3
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from runicorn import sdk
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_generate_distinct_run_ids() -> None:
+    ids = {sdk._gen_run_id()}
+    for _ in range(2):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                os.write(write_fd, sdk._gen_run_id().encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            ids.add(f.read().decode())
+        os.waitpid(pid, 0)
+
+    assert len(ids) == 3
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import runicorn as rn
+
+
+def _read_summary(run) -> dict:
+    return json.loads((run.run_dir / "summary.json").read_text(encoding="utf-8"))
+
+
+def test_summary_updates_are_coalesced_and_flushed_on_finish(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("RUNICORN_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("RUNICORN_DISABLE_MODERN_STORAGE", "1")
+
+    with rn.enabled(True):
+        run = rn.init(path="p/n", snapshot_code=False, workspace_root=str(tmp_path))
+        for i in range(50):
+            run.summary({"epoch": i})
+        run.summary({"final": True})
+        run.finish()
+
+        assert _read_summary(run) == {"epoch": 49, "final": True}
+
+        # After finish there is no flush thread; updates are written immediately
+        run.summary({"late": 1})
+        assert _read_summary(run)["late"] == 1
+
+
+def test_summary_skips_write_when_nothing_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("RUNICORN_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("RUNICORN_DISABLE_MODERN_STORAGE", "1")
+
+    with rn.enabled(True):
+        run = rn.init(path="p/n", snapshot_code=False, workspace_root=str(tmp_path))
+        run.summary({"a": 1, "b": [1, 2]})
+        run.finish()
+
+        summary_path = run.run_dir / "summary.json"
+        mtime = summary_path.stat().st_mtime_ns
+        run.summary({})
+        run.summary({"b": [1, 2]})
+        assert summary_path.stat().st_mtime_ns == mtime
+
+        run.summary({"b": [1, 2, 3]})
+        assert _read_summary(run) == {"a": 1, "b": [1, 2, 3]}
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import atexit
+from pathlib import Path
+
+import runicorn as rn
+from runicorn.index import IndexDb
+
+
+def test_index_writes_drain_on_finish_and_late_writes_are_synchronous(
+    monkeypatch, tmp_path: Path
+) -> None:
+    registered = []
+    monkeypatch.setattr(atexit, "register", lambda fn, *a, **k: registered.append(fn) or fn)
+    monkeypatch.setattr(atexit, "unregister", lambda fn: registered.remove(fn))
+    monkeypatch.setenv("RUNICORN_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("RUNICORN_DISABLE_MODERN_STORAGE", "1")
+
+    with rn.enabled(True):
+        run = rn.init(path="p", snapshot_code=False, workspace_root=str(tmp_path))
+        assert run._index_drain in registered
+        run.finish()
+    assert run._index_drain not in registered
+
+    # A write after finish() must not be queued for a worker nobody drains
+    run._index_submit("finish_run", run_id=run.id, status="failed", ended_at=1.0)
+    assert run._index_thread is None
+
+    db = IndexDb(tmp_path / "storage")
+    try:
+        assert db.get_run(run.id)["status"] == "failed"
+    finally:
+        db.close()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import math
+
+from runicorn import sdk
+
+
+def test_dumps_keeps_non_finite_floats_with_and_without_orjson(monkeypatch) -> None:
+    obj = {"loss": float("nan"), "best": float("inf"), "nested": [1.5, None, float("-inf")]}
+    outputs = []
+    for has_orjson in {sdk.HAS_ORJSON, False}:
+        monkeypatch.setattr(sdk, "HAS_ORJSON", has_orjson)
+        outputs.append(sdk._dumps(obj))
+        back = sdk._loads(outputs[-1])
+        assert math.isnan(back["loss"])
+        assert back["best"] == float("inf")
+        assert back["nested"][1] is None and back["nested"][2] == float("-inf")
+    assert len(set(outputs)) == 1
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from runicorn.viewer import create_app
+
+
+def _preflight(client: TestClient, origin: str):
+    return client.options(
+        "/api/health",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "Content-Type",
+        },
+    )
+
+
+def test_cors_allows_local_dev_origins_only(tmp_path: Path) -> None:
+    client = TestClient(create_app(str(tmp_path)))
+
+    for origin in ("http://localhost:5173", "http://127.0.0.1:8080"):
+        resp = _preflight(client, origin)
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-origin"] == origin
+        assert resp.headers["access-control-max-age"] == "86400"
+
+    resp = _preflight(client, "https://evil.example")
+    assert resp.status_code == 400
+    assert "access-control-allow-origin" not in resp.headers
+
+
+def test_api_routers_registered_and_desktop_disables_docs(monkeypatch, tmp_path: Path) -> None:
+    client = TestClient(create_app(str(tmp_path)))
+    assert client.get("/api/health").status_code == 200
+    assert client.get("/openapi.json").status_code == 200
+
+    monkeypatch.setenv("RUNICORN_DESKTOP", "1")
+    app = create_app(str(tmp_path))
+    assert app.openapi_url is None and app.docs_url is None
+    assert TestClient(app).get("/api/health").status_code == 200
+
+
+def test_frontend_dist_from_env_is_served(monkeypatch, tmp_path: Path) -> None:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<html>runicorn</html>", encoding="utf-8")
+    monkeypatch.setenv("RUNICORN_FRONTEND_DIST", str(dist))
+
+    client = TestClient(create_app(str(tmp_path / "storage")))
+    resp = client.get("/")
+    assert resp.status_code == 200
+    assert "runicorn" in resp.text
+    assert client.get("/api/health").status_code == 200
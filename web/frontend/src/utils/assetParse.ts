@@ -91,7 +91,8 @@ export function parseRunAssetsPayload(payload: any): ParsedAsset[] {
     out.push({
       kind: 'dataset',
       name,
-      saved: Boolean(d?.saved),
+      // "pending" means a background archive is still running
+      saved: d?.saved === true,
       archive_path: d?.archive_path,
       source_uri: d?.uri,
       fingerprint,
@@ -119,7 +120,7 @@ export function parseRunAssetsPayload(payload: any): ParsedAsset[] {
     out.push({
       kind: 'pretrained',
       name,
-      saved: Boolean(p?.saved),
+      saved: p?.saved === true,
       archive_path: p?.archive_path,
       source_uri: p?.path_or_uri != null ? String(p.path_or_uri) : undefined,
       fingerprint,